@@ -9,6 +9,7 @@ Handles authentication for two separate Google accounts:
 import os
 import json
 import logging
+from datetime import datetime
 from google.oauth2 import service_account
 from google.auth.transport.requests import Request
 
@@ -21,6 +22,9 @@ SCOPES = [
     'https://www.googleapis.com/auth/spreadsheets.readonly',
 ]
 
+# Refresh tokens this many seconds before they expire
+REFRESH_MARGIN = 60
+
 
 class GoogleAuthenticator:
     """Handles Google API authentication"""
@@ -61,13 +65,26 @@ class GoogleAuthenticator:
         if not self.credentials:
             raise ValueError("Credentials not initialized")
 
-        # Refresh if needed
-        if not self.credentials.valid:
+        # Refresh only when the cached token is missing or about to expire
+        if self._needs_refresh():
             logger.info("Refreshing credentials")
             self.credentials.refresh(Request())
 
         return self.credentials
 
+    def _needs_refresh(self) -> bool:
+        """
+        Check whether the cached token should be refreshed
+
+        Returns:
+            bool: True if there is no token or it expires within REFRESH_MARGIN
+        """
+        if not self.credentials.token or self.credentials.expiry is None:
+            return True
+        # google-auth stores expiry as a naive UTC datetime
+        remaining = (self.credentials.expiry - datetime.utcnow()).total_seconds()
+        return remaining < REFRESH_MARGIN
+
 
 class DualAccountAuth:
     """Manages authentication for both Google accounts"""
@@ -4,22 +4,47 @@ Conflict Handler Module
 Handles synchronization conflicts when both files are modified
 """
 
+import atexit
 import logging
 import json
+import threading
+from collections.abc import Sized
 from datetime import datetime
-from typing import List, Dict
+from typing import Dict, Iterable, Iterator, List
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 CONFLICTS_LOG_FILE = 'conflicts.log'
 
 
+def _dumps(obj) -> bytes:
+    """Serialize to JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class ConflictHandler:
     """Handles sync conflicts"""
 
     def __init__(self):
         """Initialize conflict handler"""
         self.conflicts = []
+        self._log_fh = None
+        # Sync workers record conflicts concurrently
+        self._log_lock = threading.Lock()
 
     def record_conflict(self, conflict_info: Dict):
         """
@@ -32,9 +57,9 @@ class ConflictHandler:
             'timestamp': datetime.now().isoformat(),
             'doc_id': conflict_info.get('doc_id'),
             'vault_path': conflict_info.get('vault_path'),
-            'doc_modified': conflict_info.get('doc_modified').isoformat() if conflict_info.get('doc_modified') else None,
-            'vault_modified': conflict_info.get('vault_modified').isoformat() if conflict_info.get('vault_modified') else None,
-            'last_synced': conflict_info.get('last_synced').isoformat() if conflict_info.get('last_synced') else None,
+            'doc_modified': dm.isoformat() if (dm := conflict_info.get('doc_modified')) else None,
+            'vault_modified': vm.isoformat() if (vm := conflict_info.get('vault_modified')) else None,
+            'last_synced': ls.isoformat() if (ls := conflict_info.get('last_synced')) else None,
         }
 
         self.conflicts.append(conflict)
@@ -56,12 +81,26 @@ class ConflictHandler:
             conflict: Conflict information
         """
         try:
-            with open(CONFLICTS_LOG_FILE, 'a') as f:
-                f.write(json.dumps(conflict) + '\n')
+            with self._log_lock:
+                if self._log_fh is None:
+                    # Keep the file open (unbuffered) instead of reopening per conflict
+                    self._log_fh = open(CONFLICTS_LOG_FILE, 'ab', buffering=0)
+                    atexit.register(self.close_log)
+                self._log_fh.write(_dumps(conflict) + b'\n')
             logger.debug(f"Wrote conflict to {CONFLICTS_LOG_FILE}")
         except Exception as e:
             logger.error(f"Error writing conflict to log: {e}")
 
+    def close_log(self):
+        """Close the conflicts log file handle if it is open"""
+        with self._log_lock:
+            if self._log_fh is not None:
+                self._log_fh.close()
+                self._log_fh = None
+                # Registered when the file was opened; drop it so reopening
+                # doesn't stack hooks that keep this handler alive
+                atexit.unregister(self.close_log)
+
     def get_conflicts(self) -> List[Dict]:
         """
         Get all recorded conflicts in this session
@@ -80,27 +119,38 @@ class ConflictHandler:
         """
         return len(self.conflicts)
 
-    def load_conflicts_from_log(self) -> List[Dict]:
+    def iter_conflicts_from_log(self) -> Iterator[Dict]:
         """
-        Load conflicts from log file
+        Stream conflicts from log file one entry at a time
 
-        Returns:
-            list: List of conflicts from log file
+        Yields:
+            dict: Conflict parsed from one log line
         """
         try:
-            with open(CONFLICTS_LOG_FILE, 'r') as f:
-                conflicts = [json.loads(line) for line in f]
-            logger.info(f"Loaded {len(conflicts)} conflicts from log")
-            return conflicts
+            with open(CONFLICTS_LOG_FILE, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        yield _loads(line)
         except FileNotFoundError:
             logger.info("No conflicts log file found")
-            return []
         except Exception as e:
             logger.error(f"Error loading conflicts from log: {e}")
-            return []
+
+    def load_conflicts_from_log(self) -> List[Dict]:
+        """
+        Load conflicts from log file
+
+        Returns:
+            list: List of conflicts from log file
+        """
+        conflicts = list(self.iter_conflicts_from_log())
+        if conflicts:
+            logger.info(f"Loaded {len(conflicts)} conflicts from log")
+        return conflicts
 
     def clear_conflicts_log(self):
         """Clear conflicts log file"""
+        self.close_log()
         try:
             with open(CONFLICTS_LOG_FILE, 'w') as f:
                 f.write('')
@@ -109,22 +159,29 @@ class ConflictHandler:
             logger.error(f"Error clearing conflicts log: {e}")
 
     @staticmethod
-    def print_conflict_report(conflicts: List[Dict]):
+    def print_conflict_report(conflicts: Iterable[Dict]):
         """
         Print a formatted conflict report
 
+        Conflicts are consumed one at a time, so an iterator such as
+        iter_conflicts_from_log() can be passed without building a list.
+        The header shows the count when the argument has a len(); for an
+        iterator the count is printed after the entries instead.
+
         Args:
-            conflicts: List of conflicts
+            conflicts: Iterable of conflicts
         """
-        if not conflicts:
-            print("\n✓ No conflicts found")
-            return
-
-        print(f"\n⚠️  {len(conflicts)} Conflict(s) Detected\n")
-        print("=" * 80)
-
-        for i, conflict in enumerate(conflicts, 1):
-            print(f"\nConflict #{i}")
+        total = len(conflicts) if isinstance(conflicts, Sized) else None
+        count = 0
+        for count, conflict in enumerate(conflicts, 1):
+            if count == 1:
+                if total is not None:
+                    print(f"\n⚠️  {total} Conflict(s) Detected\n")
+                else:
+                    print("\n⚠️  Conflict(s) Detected\n")
+                print("=" * 80)
+
+            print(f"\nConflict #{count}")
             print(f"  File: {conflict['vault_path']}")
             print(f"  Doc ID: {conflict['doc_id']}")
             print(f"  Detected: {conflict['timestamp']}")
@@ -133,6 +190,12 @@ class ConflictHandler:
             print(f"  Last synced: {conflict['last_synced']}")
             print("-" * 80)
 
+        if not count:
+            print("\n✓ No conflicts found")
+            return
+
+        if total is None:
+            print(f"\n{count} conflict(s) in total")
         print("\nTo resolve conflicts:")
         print("1. Manually review the conflicting files")
         print("2. Choose which version to keep or merge them manually")
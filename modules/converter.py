@@ -4,19 +4,366 @@ Document Converter Module
 Handles conversion between Google Docs and Markdown formats
 """
 
+import hashlib
 import logging
+import os
 import re
+import subprocess
 import sys
-from markdownify import markdownify as md
+import threading
+from html.parser import HTMLParser
 
 logger = logging.getLogger(__name__)
 
-# Increase recursion limit for deeply nested lists
-sys.setrecursionlimit(10000)
-
 # Configuration for large documents
 MAX_CONTENT_LENGTH = 10 * 1024 * 1024  # 10MB
 
+# HTML -> Markdown backend: 'markdownify' (default) or 'pandoc' (requires pandoc on PATH)
+CONVERTER_BACKEND = os.getenv('CONVERTER_BACKEND', 'markdownify').lower()
+PANDOC_TIMEOUT = 120  # seconds
+
+# Recent conversions keyed by a hash of the exported HTML, so re-exports of
+# an unchanged document skip the whole pipeline (oldest entry evicted first)
+CONVERSION_CACHE_SIZE = 32
+_conversion_cache = {}
+_conversion_cache_lock = threading.Lock()
+
+# HTML pre-processing: <style>, <script> and <head> sections are dropped
+# by the list parser while it walks the document
+_STRIP_TAGS = frozenset(('style', 'script', 'head'))
+# Elements allowed in <head>; any other start tag implies the optional </head>
+_HEAD_TAGS = frozenset(('base', 'link', 'meta', 'noscript', 'script', 'style', 'template', 'title'))
+# Cheap substring checks that let the parser pass be skipped when there is nothing to do
+_PREPROCESS_HINTS = ('<ul', '<style', '<script', '<head', '<STYLE', '<SCRIPT', '<HEAD')
+# Fallback used only if the parser pass fails
+_RE_STRIP = re.compile(r'<(style|script|head)\b[^>]*>.*?</\1>', re.DOTALL | re.IGNORECASE)
+
+# Pre-compiled patterns (list reconstruction)
+_RE_MARGIN = re.compile(r'margin-left:\s*(\d+)pt', re.ASCII)
+# List level for the margin-left values Google Docs emits (each 36pt is one level)
+_MARGIN_LEVEL = {str(margin): max(0, margin // 36 - 1) for margin in range(0, 36 * 10, 36)}
+_RE_KIX = re.compile(r'(lst-kix_[a-z0-9]+)-(\d+)', re.ASCII)
+
+# Pre-compiled patterns (Markdown cleanup)
+_RE_MULTI_NL = re.compile(r'\n{3,}')
+_RE_EMPTY_LINK = re.compile(r'\[\]\(.*?\)')
+_RE_LIST_SPACING = re.compile(r'(\n-\s+)\n+')
+
+# Invisible characters removed from converted Markdown:
+# zero-width space, zero-width no-break space (BOM) and word joiner
+_INVISIBLE_CHARS = str.maketrans('', '', '\u200b\ufeff\u2060')
+
+# Pre-compiled patterns (Markdown -> plain text)
+_RE_CODE_BLOCK = re.compile(r'```[\s\S]*?```')
+_RE_INLINE_CODE = re.compile(r'`([^`]+)`')
+_RE_HEADER = re.compile(r'^#{1,6}\s+(.+)$', re.MULTILINE)
+_RE_BOLD = re.compile(r'\*\*(.+?)\*\*')
+_RE_ITALIC = re.compile(r'\*(.+?)\*')
+_RE_UBOLD = re.compile(r'__(.+?)__')
+_RE_UITALIC = re.compile(r'_(.+?)_')
+_RE_LINK = re.compile(r'\[([^\]]+)\]\([^\)]+\)')
+_RE_ULIST = re.compile(r'^(\s*)[-*+]\s+', re.MULTILINE)
+_RE_OLIST = re.compile(r'^(\s*)\d+\.\s+', re.MULTILINE)
+
+
+# markdownify (and BeautifulSoup) are imported on first HTML conversion. The
+# converter only holds its options, so one instance is shared by all threads.
+_markdown_converter = None
+_markdown_converter_lock = threading.Lock()
+
+
+def _get_markdown_converter():
+    """
+    Get the shared Obsidian markdownify converter, building it on first use
+
+    Returns:
+        ObsidianMarkdownConverter: Converter configured for Obsidian output
+    """
+    global _markdown_converter
+    if _markdown_converter is not None:
+        return _markdown_converter
+    with _markdown_converter_lock:
+        if _markdown_converter is None:
+            _markdown_converter = _build_markdown_converter()
+    return _markdown_converter
+
+
+def _build_markdown_converter():
+    """
+    Import markdownify and build the Obsidian converter
+
+    Returns:
+        ObsidianMarkdownConverter: Converter configured for Obsidian output
+    """
+
+    from bs4 import BeautifulSoup
+    from markdownify import MarkdownConverter
+
+    # Build the tree with lxml's C parser when it is installed
+    try:
+        import lxml  # noqa: F401
+        soup_features = 'lxml'
+    except ImportError:
+        soup_features = 'html.parser'
+
+    class ObsidianMarkdownConverter(MarkdownConverter):
+        """markdownify converter tuned for Obsidian output"""
+
+        def convert(self, html):
+            """Parse with lxml when available instead of the pure-Python html.parser"""
+            return self.convert_soup(BeautifulSoup(html, soup_features))
+
+        def convert_li(self, el, text, convert_as_inline):
+            """
+            Convert a list item without walking its ancestors
+
+            markdownify walks every <li> up to the document root to pick a
+            bullet by nesting depth. With a single bullet style configured the
+            depth never changes the result, so the walk is skipped.
+            """
+            bullets = self.options['bullets']
+            parent = el.parent
+            if len(bullets) != 1 or (parent is not None and parent.name == 'ol'):
+                return super().convert_li(el, text, convert_as_inline)
+            return '%s %s\n' % (bullets, (text or '').strip())
+
+    return ObsidianMarkdownConverter(
+        heading_style="ATX",  # Use # for headings
+        bullets="-",  # Use - for unordered lists
+        strong_em_symbol="**",  # Use ** for bold
+        strip=['style', 'script']  # Remove style and script tags
+    )
+
+
+class _GoogleListParser(HTMLParser):
+    """Single pass over the document that strips sections and regroups <ul> blocks"""
+
+    def __init__(self, source):
+        super().__init__()
+        self.source = source
+        self.result_parts = []
+        self.cursor = 0  # End of the source already copied or consumed
+        self.group = []  # Pending (prefix, level, levels, contents, start, end) blocks
+        self.block = None  # <ul> block currently being parsed
+        # Items of the current block as parallel lists
+        self.levels = []
+        self.contents = []
+        self.li_level = 0
+        self.in_li = False
+        self.li_content = []
+        self.gap_parts = []  # Content kept between cursor and the next <ul>
+        self.strip_tag = None  # <style>/<script>/<head> section being dropped
+        self.strip_start = 0
+        # Incremental line -> offset mapping for getpos()
+        self._lineno = 1
+        self._line_start = 0
+
+    def _source_offset(self):
+        """Absolute offset in source of the tag being handled"""
+        lineno, col = self.getpos()
+        while self._lineno < lineno:
+            self._line_start = self.source.index('\n', self._line_start) + 1
+            self._lineno += 1
+        return self._line_start + col
+
+    def handle_starttag(self, tag, attrs):
+        if self.strip_tag is not None:
+            if self.strip_tag != 'head' or tag in _HEAD_TAGS:
+                return
+            # </head> was omitted: the section ends where this tag starts
+            self.end_strip(self._source_offset())
+        if tag in _STRIP_TAGS:
+            self.strip_tag = tag
+            self.strip_start = self._source_offset()
+            return
+
+        if self.block is None:
+            if tag == 'ul':
+                prefix, level = _extract_list_info(_get_attr(attrs, 'class'))
+                self.block = (prefix, level, self._source_offset())
+                self.levels = []
+                self.contents = []
+            return
+
+        if tag == 'li':
+            self.in_li = True
+            self.li_content = []
+            # Extract margin-left from style attribute
+            style = _get_attr(attrs, 'style')
+            margin_match = _RE_MARGIN.search(style)
+            if margin_match:
+                margin = margin_match.group(1)
+                level = _MARGIN_LEVEL.get(margin)
+                if level is None:
+                    # Calculate level: each 36pt is one level
+                    level = max(0, (int(margin) // 36) - 1)
+            else:
+                level = 0
+            self.li_level = level
+        elif self.in_li:
+            # Keep the start tag exactly as written in the source
+            self.li_content.append(self.get_starttag_text())
+
+    def handle_endtag(self, tag):
+        if self.strip_tag is not None:
+            if tag == self.strip_tag:
+                self.end_strip()
+            return
+
+        if self.block is None:
+            return
+
+        if tag == 'ul':
+            end = self.source.find('>', self._source_offset()) + 1
+            self.end_block(end)
+        elif tag == 'li' and self.in_li:
+            self.levels.append(self.li_level)
+            self.contents.append(''.join(self.li_content))
+            self.in_li = False
+        elif self.in_li:
+            self.li_content.append(f'</{tag}>')
+
+    def handle_data(self, data):
+        if self.in_li and self.strip_tag is None:
+            self.li_content.append(data)
+
+    def end_strip(self, end=None):
+        """
+        Drop the finished <style>/<script>/<head> section from the output
+
+        Args:
+            end: Offset where the section ends; defaults to just past the
+                end tag being handled
+        """
+        self.strip_tag = None
+        if end is None:
+            end = self.source.find('>', self._source_offset()) + 1
+        if self.block is None:
+            self.gap_parts.append(self.source[self.cursor:self.strip_start])
+            self.cursor = end
+
+    def end_block(self, end):
+        """Attach a finished <ul> block to the pending group or start a new one"""
+        prefix, level, start = self.block
+        self.block = None
+        self.in_li = False
+
+        self.gap_parts.append(self.source[self.cursor:start])
+        gap = ''.join(self.gap_parts)
+        self.gap_parts = []
+
+        # Blocks with the same prefix separated only by whitespace belong together
+        joins_group = (
+            self.group
+            and prefix
+            and prefix == self.group[0][0]
+            and (not gap or gap.isspace())
+        )
+        if not joins_group:
+            self.flush_group()
+            self.result_parts.append(gap)
+
+        self.group.append((prefix, level, self.levels, self.contents, start, end))
+        self.levels = []
+        self.contents = []
+        self.cursor = end
+
+    def flush_group(self):
+        """Emit the pending group as a single rebuilt list"""
+        if not self.group:
+            return
+
+        if len(self.group) > 1:
+            # Multiple blocks with same prefix - merge them
+            all_levels = []
+            all_contents = []
+            for _, level, levels, contents, _, _ in self.group:
+                # Use class level as the authoritative level
+                if level is not None:
+                    all_levels.extend([level] * len(contents))
+                else:
+                    all_levels.extend(levels)
+                all_contents.extend(contents)
+        else:
+            # Single block - keep levels from margin-left
+            all_levels, all_contents = self.group[0][2:4]
+
+        if all_contents:
+            self.result_parts.append('<ul>')
+            self.result_parts.extend(_emit_nested_html(all_levels, all_contents))
+            self.result_parts.append('</ul>')
+        else:
+            # Fallback: keep original blocks
+            for _, _, _, _, start, end in self.group:
+                self.result_parts.append(self.source[start:end])
+
+        self.group = []
+
+    def finish(self):
+        """Flush remaining state and return the rebuilt document"""
+        self.close()
+        self.flush_group()
+        self.result_parts.extend(self.gap_parts)
+        # Unterminated <ul> blocks, unterminated sections and trailing content are kept as-is
+        self.result_parts.append(self.source[self.cursor:])
+        return ''.join(self.result_parts)
+
+
+def _get_attr(attrs, name):
+    """Read one attribute from HTMLParser attrs without building a dict"""
+    for key, value in attrs:
+        if key == name:
+            return value or ''
+    return ''
+
+
+def _extract_list_info(class_name):
+    """Extract list prefix and level from <ul> class attribute"""
+    # Pattern: lst-kix_XXXXX-N where N is the level
+    level_match = _RE_KIX.search(class_name)
+    if level_match:
+        # Interned so every block of a list shares one prefix object; the ==
+        # in end_block then returns on its identity fast path instead of
+        # comparing characters, e.g., "lst-kix_dnvzcw1w4rp0"
+        prefix = sys.intern(level_match.group(1))
+        level = int(level_match.group(2))  # e.g., 0, 1, 2
+        return prefix, level
+    return None, None
+
+
+def _emit_nested_html(levels, contents):
+    """
+    Yield HTML fragments for list items; joined once by the caller
+
+    Each item becomes a child of the nearest preceding item with a
+    lower level. Open <li> elements are tracked on an explicit stack,
+    so every item is visited once and no recursion is needed.
+    """
+    stack = []  # [level, has_children] for each open <li>
+
+    for level, content in zip(levels, contents):
+        # Close items that cannot contain this one
+        while stack and stack[-1][0] >= level:
+            _, has_children = stack.pop()
+            if has_children:
+                yield '</ul>'
+            yield '</li>'
+
+        # First child of the enclosing item opens a nested list
+        if stack and not stack[-1][1]:
+            stack[-1][1] = True
+            yield '<ul>'
+
+        yield '<li>'
+        yield content
+        stack.append([level, False])
+
+    while stack:
+        _, has_children = stack.pop()
+        if has_children:
+            yield '</ul>'
+        yield '</li>'
+
 
 class DocumentConverter:
     """Converter for Google Docs <-> Markdown"""
@@ -40,39 +387,42 @@ class DocumentConverter:
             if content_size > MAX_CONTENT_LENGTH:
                 logger.warning(f"Large document detected: {content_size:,} bytes")
 
-            # Pre-process: Remove style and script tags with content
-            # Use more efficient non-greedy matching for large documents
-            html_content = re.sub(r'<style[^>]*>.*?</style>', '', html_content, flags=re.DOTALL | re.IGNORECASE)
-            html_content = re.sub(r'<script[^>]*>.*?</script>', '', html_content, flags=re.DOTALL | re.IGNORECASE)
-
-            # Remove head section entirely
-            html_content = re.sub(r'<head[^>]*>.*?</head>', '', html_content, flags=re.DOTALL | re.IGNORECASE)
-
-            logger.info("Reconstructing nested lists...")
-            # Reconstruct nested lists based on margin-left
-            html_content = DocumentConverter._reconstruct_nested_lists(html_content)
+            cache_key = hashlib.blake2b(
+                html_content.encode('utf-8', 'surrogatepass'), digest_size=16
+            ).digest()
+            cached = _conversion_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Converted HTML to Markdown (unchanged content, using cached result)")
+                return cached
+
+            logger.info("Pre-processing HTML and reconstructing nested lists...")
+            # Remove style, script and head sections and reconstruct nested
+            # lists based on margin-left in a single pass over the document
+            html_content = DocumentConverter._preprocess_html(html_content)
+
+            # Nothing left to convert (empty document or only whitespace)
+            if not html_content.strip():
+                logger.info("Converted HTML to Markdown (empty document)")
+                return ''
 
             # Convert HTML to Markdown
-            markdown = md(
-                html_content,
-                heading_style="ATX",  # Use # for headings
-                bullets="-",  # Use - for unordered lists
-                strong_em_symbol="**",  # Use ** for bold
-                strip=['style', 'script']  # Remove style and script tags
-            )
+            markdown = None
+            if CONVERTER_BACKEND == 'pandoc':
+                markdown = DocumentConverter._convert_with_pandoc(html_content)
+
+            if markdown is None:
+                markdown = _get_markdown_converter().convert(html_content)
 
             # Keep tabs for nested lists (Obsidian uses tabs for list indentation)
             # Do NOT convert tabs to spaces
 
-            # Clean up extra whitespace
-            markdown = re.sub(r'\n{3,}', '\n\n', markdown)  # Max 2 consecutive newlines
-            markdown = markdown.strip()
+            # Clean up whitespace and Google Docs specific artifacts
+            markdown = DocumentConverter._finalize_markdown(markdown)
 
-            # Remove trailing spaces from each line (important for proper list rendering)
-            markdown = re.sub(r' +$', '', markdown, flags=re.MULTILINE)
-
-            # Remove Google Docs specific artifacts
-            markdown = DocumentConverter._clean_google_docs_artifacts(markdown)
+            with _conversion_cache_lock:
+                if len(_conversion_cache) >= CONVERSION_CACHE_SIZE:
+                    del _conversion_cache[next(iter(_conversion_cache))]
+                _conversion_cache[cache_key] = markdown
 
             logger.info("Converted HTML to Markdown")
             return markdown
@@ -82,337 +432,114 @@ class DocumentConverter:
             raise
 
     @staticmethod
-    def _reconstruct_nested_lists(html: str) -> str:
+    def _convert_with_pandoc(html_content: str):
         """
-        Reconstruct nested list structure based on class names and margin-left
+        Convert HTML to GitHub-flavored Markdown with pandoc
 
-        Google Docs exports lists as separate <ul> blocks with class names
-        indicating list groups and nesting levels. This function groups
-        consecutive related <ul> blocks and rebuilds proper nested structure.
+        Output is not identical to markdownify: nested lists are indented
+        with spaces rather than tabs.
 
         Args:
-            html: HTML content with Google Docs list structure
+            html_content: Pre-processed HTML content
 
         Returns:
-            str: HTML with reconstructed nested lists
+            str: Markdown content, or None if pandoc is unavailable or fails
         """
         try:
-            from html.parser import HTMLParser
-        except Exception as e:
-            logger.warning(f"Error importing HTMLParser, skipping list reconstruction: {e}")
-            return html
+            # Drop Google Docs' <span class="cN">/<div> wrappers instead of
+            # carrying them through as raw HTML
+            result = subprocess.run(
+                ['pandoc', '-f', 'html-native_spans-native_divs', '-t', 'gfm-raw_html', '--wrap=none'],
+                input=html_content.encode('utf-8'),
+                capture_output=True,
+                check=True,
+                timeout=PANDOC_TIMEOUT
+            )
+            return result.stdout.decode('utf-8')
+        except FileNotFoundError:
+            logger.warning("pandoc not found on PATH, falling back to markdownify")
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            logger.warning(f"pandoc conversion failed, falling back to markdownify: {e}")
+        return None
 
-        class ListItem:
-            def __init__(self, level, content, class_level=None):
-                self.level = level
-                self.content = content
-                self.class_level = class_level  # Level from class name (-0, -1, -2)
-                self.children = []
-
-        class GoogleListParser(HTMLParser):
-            def __init__(self):
-                super().__init__()
-                self.items = []
-                self.current_item = None
-                self.in_li = False
-                self.li_content = []
-
-            def handle_starttag(self, tag, attrs):
-                if tag == 'li':
-                    self.in_li = True
-                    self.li_content = []
-                    # Extract margin-left from style attribute
-                    style = dict(attrs).get('style', '')
-                    margin_match = re.search(r'margin-left:\s*(\d+)pt', style)
-                    if margin_match:
-                        margin = int(margin_match.group(1))
-                        # Calculate level: each 36pt is one level
-                        level = max(0, (margin // 36) - 1)
-                    else:
-                        level = 0
-                    self.current_item = ListItem(level, '')
-                elif self.in_li:
-                    # Reconstruct tag for content
-                    attrs_str = ' '.join([f'{k}="{v}"' for k, v in attrs])
-                    self.li_content.append(f'<{tag} {attrs_str}>' if attrs_str else f'<{tag}>')
-
-            def handle_endtag(self, tag):
-                if tag == 'li' and self.in_li:
-                    self.current_item.content = ''.join(self.li_content)
-                    self.items.append(self.current_item)
-                    self.in_li = False
-                    self.current_item = None
-                elif self.in_li:
-                    self.li_content.append(f'</{tag}>')
-
-            def handle_data(self, data):
-                if self.in_li:
-                    self.li_content.append(data)
-
-        # Extract class name and level from <ul> tag
-        def extract_list_info(ul_tag):
-            """Extract list prefix and level from <ul> class attribute"""
-            class_match = re.search(r'class="([^"]*)"', ul_tag)
-            if not class_match:
-                return None, None
-
-            class_name = class_match.group(1)
-            # Pattern: lst-kix_XXXXX-N where N is the level
-            level_match = re.search(r'(lst-kix_[a-z0-9]+)-(\d+)', class_name)
-            if level_match:
-                prefix = level_match.group(1)  # e.g., "lst-kix_dnvzcw1w4rp0"
-                level = int(level_match.group(2))  # e.g., 0, 1, 2
-                return prefix, level
-            return None, None
-
-        # Group consecutive <ul> blocks that belong together
-        def group_consecutive_lists(html_content):
-            """Find groups of consecutive <ul> blocks with same prefix"""
-            groups = []
-            current_group = []
-            current_prefix = None
-            last_end = 0
-
-            # Find all <ul>...</ul> blocks
-            for match in re.finditer(r'<ul[^>]*>.*?</ul>', html_content, re.DOTALL):
-                ul_block = match.group(0)
-                prefix, level = extract_list_info(ul_block)
-
-                # Get content before this <ul> (non-list content)
-                before_content = html_content[last_end:match.start()]
-
-                # Check if this continues the current group
-                if prefix and prefix == current_prefix:
-                    # Same group, add to current
-                    current_group.append((ul_block, level, match.start(), match.end()))
-                else:
-                    # Different group or first group
-                    if current_group:
-                        # Save previous group
-                        groups.append({
-                            'prefix': current_prefix,
-                            'blocks': current_group,
-                            'before': groups[-1]['after'] if groups else html_content[:current_group[0][2]],
-                            'start': current_group[0][2],
-                            'end': current_group[-1][3]
-                        })
-
-                    # Start new group
-                    if prefix:
-                        current_prefix = prefix
-                        current_group = [(ul_block, level, match.start(), match.end())]
-                    else:
-                        # No prefix, treat as standalone
-                        if before_content.strip():
-                            groups.append({
-                                'prefix': None,
-                                'blocks': [(ul_block, None, match.start(), match.end())],
-                                'before': before_content,
-                                'start': match.start(),
-                                'end': match.end()
-                            })
-                        else:
-                            current_group = [(ul_block, None, match.start(), match.end())]
-                            current_prefix = None
-
-                last_end = match.end()
-
-            # Don't forget the last group
-            if current_group:
-                groups.append({
-                    'prefix': current_prefix,
-                    'blocks': current_group,
-                    'before': groups[-1]['after'] if groups else html_content[:current_group[0][2]],
-                    'start': current_group[0][2],
-                    'end': current_group[-1][3]
-                })
-                groups[-1]['after'] = html_content[last_end:]
-
-            return groups
-
-        # Build nested HTML from grouped items
-        def build_nested_html(items):
-            if not items:
-                return ''
+    @staticmethod
+    def _preprocess_html(html: str) -> str:
+        """
+        Remove style/script/head sections and reconstruct nested list structure
 
-            html_parts = []
-            i = 0
-            while i < len(items):
-                item = items[i]
-                html_parts.append(f'<li>{item.content}')
-
-                # Check if next items are children (higher level)
-                j = i + 1
-                while j < len(items) and items[j].level > item.level:
-                    j += 1
-
-                if j > i + 1:
-                    # Has children
-                    children = items[i+1:j]
-                    html_parts.append('<ul>')
-                    html_parts.append(build_nested_html(children))
-                    html_parts.append('</ul>')
-                    i = j
-                else:
-                    i += 1
-
-                html_parts.append('</li>')
-
-            return ''.join(html_parts)
-
-        # Process groups and merge consecutive blocks
-        def process_list_group(group):
-            """Process a group of related <ul> blocks"""
-            if not group or not group['blocks']:
-                return group['blocks'][0][0] if group['blocks'] else ''
-
-            # Parse all blocks in this group
-            all_items = []
-            for ul_block, class_level, _, _ in group['blocks']:
-                parser = GoogleListParser()
-                try:
-                    parser.feed(ul_block)
-                    # Update class_level if available
-                    if class_level is not None:
-                        for item in parser.items:
-                            item.class_level = class_level
-                            # Use class level if it's more reliable
-                            if class_level > 0:
-                                item.level = class_level
-                    all_items.extend(parser.items)
-                except:
-                    pass
-
-            if not all_items:
-                return ''.join([block[0] for block in group['blocks']])
-
-            # Rebuild with proper nesting
-            return f'<ul>{build_nested_html(all_items)}</ul>'
-
-        # Main processing: group consecutive lists and rebuild with proper nesting
-        # This approach merges <ul> blocks that belong together while preserving non-list content
+        Google Docs exports lists as separate <ul> blocks with class names
+        indicating list groups and nesting levels. This function groups
+        consecutive related <ul> blocks and rebuilds proper nested structure
+        based on class names and margin-left.
 
-        try:
-            # Find all <ul> positions and group them
-            ul_positions = []
-            for match in re.finditer(r'<ul[^>]*>.*?</ul>', html, re.DOTALL):
-                ul_block = match.group(0)
-                prefix, level = extract_list_info(ul_block)
-                ul_positions.append({
-                    'start': match.start(),
-                    'end': match.end(),
-                    'block': ul_block,
-                    'prefix': prefix,
-                    'level': level
-                })
-
-            if not ul_positions:
-                return html
-        except Exception as e:
-            logger.warning(f"Error finding list positions, returning original HTML: {e}")
+        The whole document is walked by a single HTMLParser pass: content
+        outside lists is copied through by offset, <style>, <script> and
+        <head> sections are dropped, list items are collected as they are
+        parsed, and each group is rebuilt once it is complete.
+
+        Args:
+            html: HTML content from Google Docs
+
+        Returns:
+            str: HTML without style/script/head sections and with reconstructed nested lists
+        """
+        if not any(hint in html for hint in _PREPROCESS_HINTS):
             return html
 
         try:
-            # Group consecutive <ul> blocks with same prefix
-            result_parts = []
-            last_pos = 0
-            i = 0
-
-            while i < len(ul_positions):
-                # Add non-list content before this block
-                result_parts.append(html[last_pos:ul_positions[i]['start']])
-
-                # Check if next blocks belong to the same group (same prefix)
-                current_prefix = ul_positions[i]['prefix']
-                group_blocks = [ul_positions[i]]
-                j = i + 1
-
-                # Look ahead to find consecutive blocks with same prefix
-                while j < len(ul_positions):
-                    # Check if there's only whitespace between blocks
-                    between_content = html[ul_positions[j-1]['end']:ul_positions[j]['start']]
-                    is_consecutive = between_content.strip() == ''
-
-                    if is_consecutive and ul_positions[j]['prefix'] == current_prefix:
-                        group_blocks.append(ul_positions[j])
-                        j += 1
-                    else:
-                        break
-
-                # Process this group
-                if len(group_blocks) > 1 and current_prefix:
-                    # Multiple blocks with same prefix - merge them
-                    all_items = []
-                    for block_info in group_blocks:
-                        parser = GoogleListParser()
-                        try:
-                            parser.feed(block_info['block'])
-                            # Set level from class if available
-                            if block_info['level'] is not None:
-                                for item in parser.items:
-                                    item.class_level = block_info['level']
-                                    # Use class level as the authoritative level
-                                    item.level = block_info['level']
-                            all_items.extend(parser.items)
-                        except:
-                            pass
-
-                    if all_items:
-                        result_parts.append(f'<ul>{build_nested_html(all_items)}</ul>')
-                    else:
-                        # Fallback: keep original blocks
-                        for block_info in group_blocks:
-                            result_parts.append(block_info['block'])
-
-                    last_pos = group_blocks[-1]['end']
-                    i = j
-                else:
-                    # Single block or no prefix - process normally
-                    parser = GoogleListParser()
-                    try:
-                        parser.feed(group_blocks[0]['block'])
-                        if parser.items:
-                            result_parts.append(f'<ul>{build_nested_html(parser.items)}</ul>')
-                        else:
-                            result_parts.append(group_blocks[0]['block'])
-                    except:
-                        result_parts.append(group_blocks[0]['block'])
-
-                    last_pos = group_blocks[0]['end']
-                    i += 1
-
-            # Add remaining content
-            result_parts.append(html[last_pos:])
-
-            reconstructed_html = ''.join(result_parts)
-            logger.info(f"List reconstruction completed (original: {len(html):,} -> result: {len(reconstructed_html):,} bytes)")
+            parser = _GoogleListParser(html)
+            parser.feed(html)
+            reconstructed_html = parser.finish()
+            logger.info(f"HTML pre-processing completed (original: {len(html):,} -> result: {len(reconstructed_html):,} bytes)")
             return reconstructed_html
 
         except Exception as e:
             logger.error(f"Error during list reconstruction: {e}", exc_info=True)
-            logger.warning("Returning original HTML without list reconstruction")
-            return html
+            logger.warning("Returning HTML without list reconstruction")
+            return _RE_STRIP.sub('', html)
 
     @staticmethod
-    def _clean_google_docs_artifacts(markdown: str) -> str:
+    def _finalize_markdown(markdown: str) -> str:
         """
-        Clean Google Docs specific artifacts from markdown
+        Normalize whitespace and remove Google Docs artifacts from converted markdown
+
+        Runs of empty lines are collapsed to one (at most 2 consecutive
+        newlines) and trailing spaces are removed from each line (important
+        for proper list rendering) in a single pass over the lines. Empty
+        links, blank lines after list items and invisible characters are
+        then removed from the joined result.
 
         Args:
             markdown: Markdown content
 
         Returns:
-            str: Cleaned markdown
+            str: Normalized markdown
         """
+        lines = []
+        append = lines.append
+        previous_empty = False
+
+        for line in markdown.split('\n'):
+            if not line:
+                if previous_empty:
+                    continue
+                previous_empty = True
+            else:
+                previous_empty = False
+            append(line.rstrip(' '))
+
+        markdown = '\n'.join(lines).strip()
+
         # Remove empty links
-        markdown = re.sub(r'\[\]\(.*?\)', '', markdown)
+        if '[](' in markdown:
+            markdown = _RE_EMPTY_LINK.sub('', markdown)
 
         # Clean up excessive spacing in lists
-        markdown = re.sub(r'(\n-\s+)\n+', r'\1', markdown)
+        if '\n-' in markdown:
+            markdown = _RE_LIST_SPACING.sub(r'\1', markdown)
 
-        # Remove zero-width spaces and other invisible characters
-        markdown = markdown.replace('\u200b', '')  # Zero-width space
-        markdown = markdown.replace('\ufeff', '')  # Zero-width no-break space
+        # Remove zero-width spaces and other invisible characters in one pass
+        markdown = markdown.translate(_INVISIBLE_CHARS)
 
         return markdown
 
@@ -433,31 +560,39 @@ class DocumentConverter:
         try:
             text = markdown_content
 
+            # Each pass is skipped when its marker character is absent,
+            # so plain paragraphs don't pay for a full regex scan per pass
+
             # Remove code blocks
-            text = re.sub(r'```[\s\S]*?```', '', text)
-            text = re.sub(r'`([^`]+)`', r'\1', text)
+            if '`' in text:
+                text = _RE_CODE_BLOCK.sub('', text)
+                text = _RE_INLINE_CODE.sub(r'\1', text)
 
             # Convert headers to plain text (keep the text, add newlines)
-            text = re.sub(r'^#{1,6}\s+(.+)$', r'\1\n', text, flags=re.MULTILINE)
+            if '#' in text:
+                text = _RE_HEADER.sub(r'\1\n', text)
 
             # Convert bold and italic
-            text = re.sub(r'\*\*(.+?)\*\*', r'\1', text)
-            text = re.sub(r'\*(.+?)\*', r'\1', text)
-            text = re.sub(r'__(.+?)__', r'\1', text)
-            text = re.sub(r'_(.+?)_', r'\1', text)
+            if '*' in text:
+                text = _RE_BOLD.sub(r'\1', text)
+                text = _RE_ITALIC.sub(r'\1', text)
+            if '_' in text:
+                text = _RE_UBOLD.sub(r'\1', text)
+                text = _RE_UITALIC.sub(r'\1', text)
 
             # Convert links [text](url) to just text
-            text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
+            if '](' in text:
+                text = _RE_LINK.sub(r'\1', text)
 
             # Convert lists while preserving indentation
             # Convert tabs to 4 spaces for Google Docs compatibility
             text = text.replace('\t', '    ')
             # Remove list markers but keep indentation
-            text = re.sub(r'^(\s*)[-*+]\s+', r'\1', text, flags=re.MULTILINE)
-            text = re.sub(r'^(\s*)\d+\.\s+', r'\1', text, flags=re.MULTILINE)
+            text = _RE_ULIST.sub(r'\1', text)
+            text = _RE_OLIST.sub(r'\1', text)
 
             # Clean up extra whitespace
-            text = re.sub(r'\n{3,}', '\n\n', text)
+            text = _RE_MULTI_NL.sub('\n\n', text)
             text = text.strip()
 
             logger.info("Converted Markdown to plain text")
@@ -6,23 +6,194 @@ Provides clients for interacting with Google Drive API:
 - VaultDriveClient: For Markdown files in Obsidian vault (Account B)
 """
 
+import hashlib
 import io
 import logging
+import random
+import ssl
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, List
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseDownload, MediaIoBaseUpload
+from typing import Optional, Dict, List, Tuple
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.http import MediaInMemoryUpload, MediaIoBaseUpload, build_http
 from googleapiclient.errors import HttpError
-import socket
+from googleapiclient.model import JsonModel
+import google_auth_httplib2
+import httplib2
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 # Retry configuration
 MAX_RETRIES = 3
-RETRY_DELAY = 2  # seconds
+RETRY_DELAY = 2  # seconds, base of the exponential backoff
+RETRY_MAX_DELAY = 30  # seconds
+RETRYABLE_STATUSES = frozenset((408, 429, 500, 502, 503, 504))
+# Transport failures worth retrying; anything else is a real error
+RETRYABLE_EXCEPTIONS = (TimeoutError, ConnectionError, ssl.SSLError, httplib2.HttpLib2Error)
 TIMEOUT = 60  # seconds
 
+# Drive batch requests accept at most 100 calls
+BATCH_SIZE = 100
+# Maximum folder depth walked when listing the vault tree
+MAX_FOLDER_DEPTH = 20
+# Folders listed per files.list query when indexing the vault
+INDEX_QUERY_FOLDERS = 50
+FOLDER_MIME_TYPE = 'application/vnd.google-apps.folder'
+# Worker threads used by the batch vault operations
+VAULT_WORKERS = 8
+# Uploads at least this large use a resumable session instead of one multipart request
+RESUMABLE_UPLOAD_THRESHOLD = 5 * 1024 * 1024  # bytes
+
+# Discovery documents already read from disk, by (API name, version)
+_discovery_docs: Dict[Tuple[str, str], str] = {}
+
+
+def _get_discovery_doc(service_name: str, version: str) -> str:
+    """
+    Get the bundled discovery document, reading it from disk only once
+
+    Args:
+        service_name: API name (e.g., 'drive')
+        version: API version (e.g., 'v3')
+
+    Returns:
+        str: Discovery document JSON
+    """
+    key = (service_name, version)
+    doc = _discovery_docs.get(key)
+    if doc is None:
+        doc = discovery_cache.get_static_doc(service_name, version)
+        _discovery_docs[key] = doc
+    return doc
+
+
+class _OrjsonModel(JsonModel):
+    """JsonModel that parses response bodies with orjson"""
+
+    def deserialize(self, content):
+        """
+        Parse a JSON response body
+
+        Request bodies keep the stock json serializer, which escapes
+        non-ASCII text the way httplib2 needs it.
+
+        Args:
+            content: Response body (bytes or str)
+
+        Returns:
+            Parsed body, or the body as text if it is not JSON
+        """
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+        if self._data_wrapper and 'data' in body:
+            body = body['data']
+        return body
+
+
+def _build_service(service_name: str, version: str, credentials):
+    """
+    Build a Google API service from the bundled discovery document
+
+    The document ships with google-api-python-client, so no HTTPS request
+    is made for it, and it is kept in memory after the first build so the
+    per-thread vault services and every client rebuilt on a sheet reload
+    skip the file read. Each service gets its own authorized HTTP
+    transport carrying the request timeout, so no process-wide socket
+    default is needed.
+
+    Args:
+        service_name: API name (e.g., 'drive')
+        version: API version (e.g., 'v3')
+        credentials: Google OAuth2 credentials
+
+    Returns:
+        googleapiclient.discovery.Resource
+    """
+    # build_http() drops 308 from the redirect codes, since Drive answers
+    # resumable upload chunks with 308 Resume Incomplete
+    transport = build_http()
+    transport.timeout = TIMEOUT
+    http = google_auth_httplib2.AuthorizedHttp(credentials, http=transport)
+    # None of the APIs used here declare the dataWrapper feature
+    model = _OrjsonModel() if orjson is not None else None
+    doc = _get_discovery_doc(service_name, version)
+    if doc is None:
+        # Not bundled with this client version: fetch it over the network
+        return build(
+            service_name,
+            version,
+            http=http,
+            model=model,
+            static_discovery=False,
+            cache_discovery=False
+        )
+    return build_from_document(doc, http=http, model=model)
+
+
+def _escape_q(value: str) -> str:
+    """
+    Escape a value for use inside a quoted Drive query string
+
+    Args:
+        value: Raw value, e.g. a file name containing quotes
+
+    Returns:
+        str: Value with backslashes and single quotes escaped
+    """
+    return value.replace('\\', '\\\\').replace("'", "\\'")
+
+
+def _retry_http(func, description: str):
+    """
+    Call func, retrying transient failures with full-jitter exponential backoff
+
+    HTTP errors are retried only for rate limiting and server errors;
+    of other exceptions only transport failures (timeouts, dropped
+    connections, TLS errors) are retried.
+    A Retry-After header sent by the server is honored as a lower bound,
+    capped at RETRY_MAX_DELAY so a worker is never parked indefinitely.
+
+    Args:
+        func: Callable performing the request
+        description: What is being done, for log messages
+
+    Returns:
+        The result of func
+    """
+    for attempt in range(MAX_RETRIES):
+        try:
+            return func()
+        except HttpError as e:
+            if e.resp.status not in RETRYABLE_STATUSES:
+                raise
+            error = e
+        except RETRYABLE_EXCEPTIONS as e:
+            error = e
+
+        if attempt == MAX_RETRIES - 1:
+            logger.error(f"Failed {description} after {MAX_RETRIES} attempts")
+            raise error
+
+        delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_DELAY * 2 ** attempt))
+        retry_after = error.resp.get('retry-after') if isinstance(error, HttpError) else None
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, min(int(retry_after), RETRY_MAX_DELAY))
+        logger.warning(
+            f"Error {description} (attempt {attempt + 1}/{MAX_RETRIES}), "
+            f"retrying in {delay:.1f}s: {error}"
+        )
+        time.sleep(delay)
+
 
 class GoogleSheetsClient:
     """Client for reading mappings from Google Sheets"""
@@ -35,7 +206,34 @@ class GoogleSheetsClient:
             credentials: Google OAuth2 credentials
         """
         self.credentials = credentials
-        self.sheets_service = build('sheets', 'v4', credentials=credentials)
+        self.sheets_service = _build_service('sheets', 'v4', credentials)
+        self._drive_service = None
+
+    def get_modified_time(self, sheet_id: str) -> Optional[str]:
+        """
+        Get last modified time of the spreadsheet from Drive
+
+        A cheap metadata request that tells callers whether the mappings
+        need to be read again.
+
+        Args:
+            sheet_id: Spreadsheet ID
+
+        Returns:
+            str: RFC 3339 modified time, or None if it could not be read
+        """
+        if self._drive_service is None:
+            self._drive_service = _build_service('drive', 'v3', self.credentials)
+        try:
+            file = self._drive_service.files().get(
+                fileId=sheet_id,
+                fields='modifiedTime',
+                supportsAllDrives=True
+            ).execute()
+        except HttpError as e:
+            logger.warning(f"Error getting modified time for sheet {sheet_id}: {e}")
+            return None
+        return file.get('modifiedTime')
 
     def get_mappings(self, sheet_id: str, sheet_range: str) -> List[Dict[str, str]]:
         """
@@ -48,10 +246,13 @@ class GoogleSheetsClient:
         Returns:
             list: [{ 'doc_id': ..., 'vault_path': ... }, ...]
         """
-        result = self.sheets_service.spreadsheets().values().get(
-            spreadsheetId=sheet_id,
-            range=sheet_range
-        ).execute()
+        result = _retry_http(
+            self.sheets_service.spreadsheets().values().get(
+                spreadsheetId=sheet_id,
+                range=sheet_range
+            ).execute,
+            f"reading sheet {sheet_id}"
+        )
         values = result.get('values', [])
 
         if not values or len(values) < 2:
@@ -65,19 +266,16 @@ class GoogleSheetsClient:
         except ValueError:
             raise ValueError("Sheet header must include 'doc_id' and 'vault_path'")
 
-        mappings: List[Dict[str, str]] = []
-        for row in values[1:]:
-            # Guard missing columns
-            doc_id = row[doc_idx].strip() if len(row) > doc_idx and row[doc_idx] else ''
-            vault_path = row[vault_idx].strip() if len(row) > vault_idx and row[vault_idx] else ''
-
-            if not doc_id or not vault_path:
-                continue
-
-            mappings.append({
-                'doc_id': doc_id,
-                'vault_path': vault_path
-            })
+        # Rows missing either column are skipped; trailing empty cells are
+        # omitted by the API, so a short row cannot hold both values
+        min_len = max(doc_idx, vault_idx) + 1
+        mappings: List[Dict[str, str]] = [
+            {'doc_id': doc_id, 'vault_path': vault_path}
+            for row in values[1:]
+            if len(row) >= min_len
+            and (doc_id := row[doc_idx].strip())
+            and (vault_path := row[vault_idx].strip())
+        ]
 
         logger.info(f"Loaded {len(mappings)} mapping(s) from Google Sheet")
         return mappings
@@ -94,12 +292,24 @@ class GoogleDocsClient:
             credentials: Google OAuth2 credentials
         """
         self.credentials = credentials
-        # Set timeout for HTTP requests
-        self.drive_service = build('drive', 'v3', credentials=credentials)
-        self.docs_service = build('docs', 'v1', credentials=credentials)
-
-        # Set default socket timeout
-        socket.setdefaulttimeout(TIMEOUT)
+        # httplib2 connections are not thread-safe, so each thread builds its own services
+        self._local = threading.local()
+
+    @property
+    def drive_service(self):
+        """Drive service for the calling thread"""
+        service = getattr(self._local, 'drive_service', None)
+        if service is None:
+            service = self._local.drive_service = _build_service('drive', 'v3', self.credentials)
+        return service
+
+    @property
+    def docs_service(self):
+        """Docs service for the calling thread"""
+        service = getattr(self._local, 'docs_service', None)
+        if service is None:
+            service = self._local.docs_service = _build_service('docs', 'v1', self.credentials)
+        return service
 
     def get_doc_content(self, doc_id: str) -> str:
         """
@@ -111,48 +321,21 @@ class GoogleDocsClient:
         Returns:
             str: Document content in HTML format
         """
-        last_error = None
-
-        for attempt in range(MAX_RETRIES):
-            try:
-                # Export as HTML
-                request = self.drive_service.files().export_media(
+        try:
+            # Export as HTML
+            content = _retry_http(
+                self.drive_service.files().export_media(
                     fileId=doc_id,
                     mimeType='text/html'
-                )
-                content = request.execute()
-                logger.info(f"Retrieved content from Google Doc: {doc_id}")
-                return content.decode('utf-8')
-
-            except socket.timeout as e:
-                last_error = e
-                logger.warning(f"Timeout retrieving doc {doc_id} (attempt {attempt + 1}/{MAX_RETRIES})")
-                if attempt < MAX_RETRIES - 1:
-                    time.sleep(RETRY_DELAY * (attempt + 1))  # Exponential backoff
-                    continue
-
-            except HttpError as e:
-                # Don't retry on 404 or permission errors
-                if e.resp.status in [404, 403]:
-                    logger.error(f"Error retrieving doc {doc_id}: {e}")
-                    raise
-                # Retry on other HTTP errors
-                last_error = e
-                logger.warning(f"HTTP error retrieving doc {doc_id} (attempt {attempt + 1}/{MAX_RETRIES}): {e}")
-                if attempt < MAX_RETRIES - 1:
-                    time.sleep(RETRY_DELAY * (attempt + 1))
-                    continue
-
-            except Exception as e:
-                last_error = e
-                logger.warning(f"Error retrieving doc {doc_id} (attempt {attempt + 1}/{MAX_RETRIES}): {e}")
-                if attempt < MAX_RETRIES - 1:
-                    time.sleep(RETRY_DELAY * (attempt + 1))
-                    continue
+                ).execute,
+                f"retrieving doc {doc_id}"
+            )
+        except HttpError as e:
+            logger.error(f"Error retrieving doc {doc_id}: {e}")
+            raise
 
-        # All retries failed
-        logger.error(f"Failed to retrieve doc {doc_id} after {MAX_RETRIES} attempts")
-        raise last_error
+        logger.info(f"Retrieved content from Google Doc: {doc_id}")
+        return content.decode('utf-8')
 
     def get_doc_plain_text(self, doc_id: str) -> str:
         """
@@ -165,11 +348,13 @@ class GoogleDocsClient:
             str: Document content in plain text
         """
         try:
-            request = self.drive_service.files().export_media(
-                fileId=doc_id,
-                mimeType='text/plain'
+            content = _retry_http(
+                self.drive_service.files().export_media(
+                    fileId=doc_id,
+                    mimeType='text/plain'
+                ).execute,
+                f"retrieving plain text of doc {doc_id}"
             )
-            content = request.execute()
             logger.info(f"Retrieved plain text from Google Doc: {doc_id}")
             return content.decode('utf-8')
         except HttpError as e:
@@ -187,12 +372,17 @@ class GoogleDocsClient:
         Returns:
             bool: True if successful
         """
-        try:
+        def replace_content():
             # Get current document to find the end index
             doc = self.docs_service.documents().get(documentId=doc_id).execute()
             doc_content = doc.get('body').get('content')
             end_index = doc_content[-1].get('endIndex') - 1
 
+            # The body always ends with a newline that cannot be deleted
+            if self._get_body_text(doc_content)[:-1] == content:
+                logger.debug(f"Skipping unchanged Google Doc: {doc_id}")
+                return
+
             # Delete all content first
             requests = [
                 {
@@ -218,12 +408,33 @@ class GoogleDocsClient:
                 body={'requests': requests}
             ).execute()
 
+        try:
+            # Retrying is safe: each attempt re-reads the current end index
+            _retry_http(replace_content, f"updating doc {doc_id}")
             logger.info(f"Updated Google Doc: {doc_id}")
             return True
         except HttpError as e:
             logger.error(f"Error updating doc {doc_id}: {e}")
             raise
 
+    @staticmethod
+    def _get_body_text(doc_content: List[Dict]) -> str:
+        """
+        Extract the plain text of a document body
+
+        Args:
+            doc_content: The 'content' list of a Docs API document body
+
+        Returns:
+            str: Concatenated text runs of all top-level paragraphs
+        """
+        return ''.join(
+            element['textRun'].get('content', '')
+            for block in doc_content
+            for element in block.get('paragraph', {}).get('elements', [])
+            if 'textRun' in element
+        )
+
     def get_modified_time(self, doc_id: str) -> datetime:
         """
         Get last modified time of Google Doc
@@ -235,10 +446,13 @@ class GoogleDocsClient:
             datetime: Last modified timestamp
         """
         try:
-            file = self.drive_service.files().get(
-                fileId=doc_id,
-                fields='modifiedTime'
-            ).execute()
+            file = _retry_http(
+                self.drive_service.files().get(
+                    fileId=doc_id,
+                    fields='modifiedTime'
+                ).execute,
+                f"getting modified time for doc {doc_id}"
+            )
             modified_time_str = file.get('modifiedTime')
             modified_time = datetime.fromisoformat(modified_time_str.replace('Z', '+00:00'))
             logger.debug(f"Doc {doc_id} modified at: {modified_time}")
@@ -255,6 +469,100 @@ class GoogleDocsClient:
                 logger.error(f"Error getting modified time for doc {doc_id}: {e}")
             raise
 
+    def get_modified_times_batch(self, doc_ids: List[str]) -> Dict[str, datetime]:
+        """
+        Get last modified times of several Google Docs with batch requests
+
+        Docs that could not be read are left out, so callers can fall back
+        to get_modified_time() for them and get its error reporting.
+
+        Args:
+            doc_ids: Google Doc IDs
+
+        Returns:
+            dict: Doc ID -> last modified timestamp
+        """
+        modified_times: Dict[str, datetime] = {}
+
+        def on_response(request_id, response, exception):
+            if exception is None and response.get('modifiedTime'):
+                modified_times[request_id] = datetime.fromisoformat(
+                    response['modifiedTime'].replace('Z', '+00:00')
+                )
+
+        doc_ids = list(dict.fromkeys(doc_ids))
+        for start in range(0, len(doc_ids), BATCH_SIZE):
+            batch = self.drive_service.new_batch_http_request(callback=on_response)
+            for doc_id in doc_ids[start:start + BATCH_SIZE]:
+                batch.add(
+                    self.drive_service.files().get(fileId=doc_id, fields='modifiedTime'),
+                    request_id=doc_id
+                )
+            try:
+                _retry_http(batch.execute, "getting doc modified times in batch")
+            except HttpError as e:
+                logger.warning(f"Error getting doc modified times in batch: {e}")
+
+        return modified_times
+
+    def get_start_page_token(self) -> str:
+        """
+        Get the Drive changes token marking the current point in time
+
+        Returns:
+            str: Page token to pass to get_changes() on the next poll
+        """
+        response = _retry_http(
+            self.drive_service.changes().getStartPageToken(supportsAllDrives=True).execute,
+            "getting changes start page token"
+        )
+        return response['startPageToken']
+
+    def get_changes(self, page_token: str) -> Tuple[Dict[str, Optional[datetime]], str]:
+        """
+        List files changed since page_token
+
+        A single paginated changes.list call replaces polling the
+        modified time of every document.
+
+        Args:
+            page_token: Token from get_start_page_token() or a previous call
+
+        Returns:
+            tuple: ({file_id: modified time or None if removed}, new start page token)
+        """
+        changed: Dict[str, Optional[datetime]] = {}
+        while True:
+            response = _retry_http(
+                self.drive_service.changes().list(
+                    pageToken=page_token,
+                    fields='nextPageToken,newStartPageToken,'
+                           'changes(fileId,removed,time,file(modifiedTime))',
+                    pageSize=1000,
+                    supportsAllDrives=True,
+                    includeItemsFromAllDrives=True
+                ).execute,
+                "listing drive changes"
+            )
+
+            for change in response.get('changes', []):
+                file_id = change.get('fileId')
+                if not file_id:
+                    continue
+                if change.get('removed'):
+                    changed[file_id] = None
+                    continue
+                modified_time_str = change.get('file', {}).get('modifiedTime') or change.get('time')
+                changed[file_id] = (
+                    datetime.fromisoformat(modified_time_str.replace('Z', '+00:00'))
+                    if modified_time_str else None
+                )
+
+            if 'newStartPageToken' in response:
+                logger.debug(f"Drive reported {len(changed)} changed file(s)")
+                return changed, response['newStartPageToken']
+            page_token = response['nextPageToken']
+
     def get_doc_info(self, doc_id: str) -> Dict:
         """
         Get Google Doc metadata
@@ -288,52 +596,194 @@ class VaultDriveClient:
             vault_folder_id: Google Drive folder ID containing the vault
         """
         self.credentials = credentials
-        self.drive_service = build('drive', 'v3', credentials=credentials)
         self.vault_folder_id = vault_folder_id
+        # httplib2 connections are not thread-safe, so each thread builds its own service
+        self._local = threading.local()
+        self._executor = None
+        self._file_cache: Dict[str, Dict] = {}  # Relative path -> {'id', 'modifiedTime', 'md5Checksum'}
+        self._folder_id_cache: Dict[Tuple[str, str], str] = {}  # (parent ID, name) -> folder ID
+        self._vault_index: Optional[Dict[str, Dict]] = None  # File name -> {'id', 'modifiedTime', 'md5Checksum'}
+        self._vault_index_lock = threading.Lock()
+        # Serializes folder creation so concurrent writes don't create duplicate folders
+        self._folder_lock = threading.Lock()
+
+    @property
+    def drive_service(self):
+        """Drive service for the calling thread"""
+        service = getattr(self._local, 'drive_service', None)
+        if service is None:
+            service = self._local.drive_service = _build_service('drive', 'v3', self.credentials)
+        return service
+
+    def _map_paths(self, func, relative_paths: List[str]) -> Dict:
+        """
+        Run func for each distinct path on the worker threads
+
+        Args:
+            func: Method taking a relative path
+            relative_paths: Paths relative to vault root
+
+        Returns:
+            dict: Path -> func result (the first error raised is re-raised)
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=VAULT_WORKERS,
+                thread_name_prefix='vault'
+            )
+        paths = list(dict.fromkeys(relative_paths))
+        return dict(zip(paths, self._executor.map(func, paths)))
+
+    def get_modified_times_batch(self, relative_paths: List[str]) -> Dict[str, Optional[datetime]]:
+        """
+        Get last modified times of several files concurrently
+
+        Args:
+            relative_paths: Paths relative to vault root
+
+        Returns:
+            dict: Path -> last modified timestamp or None if not found
+        """
+        return self._map_paths(self.get_modified_time, relative_paths)
+
+    def clear_cache(self):
+        """Forget cached IDs so files moved or trashed in Drive are looked up again"""
+        self._file_cache.clear()
+        self._folder_id_cache.clear()
+        self._vault_index = None
+
+    def _get_vault_index(self) -> Optional[Dict[str, Dict]]:
+        """
+        Get the file name index of the vault, building it on first use
+
+        Returns:
+            dict: File name -> file metadata, or None if the vault could not be listed
+        """
+        with self._vault_index_lock:
+            if self._vault_index is None:
+                try:
+                    self._vault_index = self._build_vault_index()
+                except HttpError as e:
+                    logger.warning(f"Error indexing vault, falling back to per-file search: {e}")
+            return self._vault_index
+
+    def _build_vault_index(self) -> Dict[str, Dict]:
+        """
+        List the whole vault tree breadth-first and index it by file name
+
+        Each level of folders is listed with as few files.list queries as
+        possible by OR-ing their 'in parents' clauses. Shallower files win
+        for duplicate names, so files in the vault root are preferred as in
+        the per-file search. Folders found on the way are recorded in the
+        folder ID cache, so creating files later needs no folder lookups.
+
+        Returns:
+            dict: File name -> {'id', 'modifiedTime', 'md5Checksum'}
+        """
+        index: Dict[str, Dict] = {}
+        level = [self.vault_folder_id]
+
+        for _ in range(MAX_FOLDER_DEPTH):
+            next_level = []
+            for start in range(0, len(level), INDEX_QUERY_FOLDERS):
+                parents_query = ' or '.join(
+                    f"'{folder_id}' in parents"
+                    for folder_id in level[start:start + INDEX_QUERY_FOLDERS]
+                )
+                query = f"({parents_query}) and trashed=false"
+                page_token = None
+                while True:
+                    results = _retry_http(
+                        self.drive_service.files().list(
+                            q=query,
+                            spaces='drive',
+                            fields='nextPageToken, files(id, name, mimeType, parents, modifiedTime, md5Checksum)',
+                            pageSize=1000,
+                            pageToken=page_token,
+                            supportsAllDrives=True
+                        ).execute,
+                        "indexing vault"
+                    )
+                    for file in results.get('files', []):
+                        index.setdefault(
+                            file['name'],
+                            {
+                                'id': file['id'],
+                                'modifiedTime': file.get('modifiedTime'),
+                                'md5Checksum': file.get('md5Checksum')
+                            }
+                        )
+                        if file.get('mimeType') == FOLDER_MIME_TYPE:
+                            next_level.append(file['id'])
+                            for parent_id in file.get('parents', []):
+                                self._folder_id_cache.setdefault((parent_id, file['name']), file['id'])
+                    page_token = results.get('nextPageToken')
+                    if not page_token:
+                        break
+
+            if not next_level:
+                break
+            level = next_level
+
+        logger.info(f"Indexed {len(index)} name(s) in vault")
+        return index
 
     def _get_file_id_by_name(self, filename: str) -> Optional[str]:
         """
         Search for file by name in entire vault (recursively)
 
+        The vault tree is searched breadth-first: each query asks for the
+        file and for the subfolders to descend into, across a whole level
+        of folders at once, so files in the vault root are found first and
+        nothing outside the vault is ever listed.
+
         Args:
             filename: File name to search for (e.g., "SignalPlus Log.md")
 
         Returns:
             str: File ID or None if not found
         """
-        # Search in entire vault folder and subfolders
-        # Use 'in parents' to search within vault and its descendants
-        query = f"name='{filename}' and '{self.vault_folder_id}' in parents and trashed=false"
+        name_query = f"name='{_escape_q(filename)}'"
+        level = [self.vault_folder_id]
 
         try:
-            # First try: search directly in vault root
-            results = self.drive_service.files().list(
-                q=query,
-                spaces='drive',
-                fields='files(id, name, parents)',
-                supportsAllDrives=True
-            ).execute()
-            files = results.get('files', [])
-
-            if files:
-                logger.info(f"Found file '{filename}' with ID: {files[0]['id']}")
-                return files[0]['id']
-
-            # Second try: recursive search in all subfolders
-            query = f"name='{filename}' and trashed=false"
-            results = self.drive_service.files().list(
-                q=query,
-                spaces='drive',
-                fields='files(id, name, parents)',
-                supportsAllDrives=True
-            ).execute()
-            files = results.get('files', [])
-
-            # Filter files that are within vault folder tree
-            for file in files:
-                if self._is_file_in_vault(file):
-                    logger.info(f"Found file '{filename}' in subfolder with ID: {file['id']}")
-                    return file['id']
+            for _ in range(MAX_FOLDER_DEPTH):
+                next_level = []
+                for start in range(0, len(level), INDEX_QUERY_FOLDERS):
+                    parents_query = ' or '.join(
+                        f"'{folder_id}' in parents"
+                        for folder_id in level[start:start + INDEX_QUERY_FOLDERS]
+                    )
+                    query = (
+                        f"({name_query} or mimeType='{FOLDER_MIME_TYPE}') "
+                        f"and ({parents_query}) and trashed=false"
+                    )
+                    page_token = None
+                    while True:
+                        results = _retry_http(
+                            self.drive_service.files().list(
+                                q=query,
+                                spaces='drive',
+                                fields='nextPageToken, files(id, name, mimeType)',
+                                pageSize=1000,
+                                pageToken=page_token,
+                                supportsAllDrives=True
+                            ).execute,
+                            f"searching for file {filename}"
+                        )
+                        for file in results.get('files', []):
+                            if file.get('mimeType') == FOLDER_MIME_TYPE:
+                                next_level.append(file['id'])
+                            elif file['name'] == filename:
+                                logger.info(f"Found file '{filename}' with ID: {file['id']}")
+                                return file['id']
+                        page_token = results.get('nextPageToken')
+                        if not page_token:
+                            break
+
+                if not next_level:
+                    break
+                level = next_level
 
             logger.warning(f"File not found in vault: {filename}")
             return None
@@ -342,57 +792,64 @@ class VaultDriveClient:
             logger.error(f"Error searching for file {filename}: {e}")
             return None
 
-    def _is_file_in_vault(self, file: Dict) -> bool:
+    def _get_file_id_by_path(self, relative_path: str) -> Optional[str]:
         """
-        Check if file is within vault folder tree
+        Get file ID by relative path within vault
+
+        This method first tries to find by filename only (flexible),
+        then falls back to exact path matching (strict)
 
         Args:
-            file: File metadata dict with 'parents' field
+            relative_path: Path relative to vault root (e.g., "01. Inbox/note.md")
 
         Returns:
-            bool: True if file is in vault tree
+            str: File ID or None if not found
         """
-        if 'parents' not in file:
-            return False
+        file = self._resolve_file(relative_path)
+        return file['id'] if file else None
 
-        parents = file['parents']
-        current_id = parents[0] if parents else None
+    def _resolve_file(self, relative_path: str) -> Optional[Dict]:
+        """
+        Get file ID and, when already known, modification time by relative path
 
-        # Traverse up to check if we reach vault folder
-        max_depth = 20  # Prevent infinite loop
-        depth = 0
+        Files found through the vault index carry their modifiedTime and
+        md5Checksum, so callers need no further request for them.
 
-        while current_id and depth < max_depth:
-            if current_id == self.vault_folder_id:
-                return True
-
-            try:
-                parent = self.drive_service.files().get(
-                    fileId=current_id,
-                    fields='parents'
-                ).execute()
-
-                if 'parents' in parent and parent['parents']:
-                    current_id = parent['parents'][0]
-                else:
-                    break
+        Args:
+            relative_path: Path relative to vault root
 
-            except HttpError:
-                break
+        Returns:
+            dict: {'id': ..., 'modifiedTime': ..., 'md5Checksum': ...} (None
+                when unknown) or None if not found
+        """
+        file = self._file_cache.get(relative_path)
+        if file:
+            return file
 
-            depth += 1
+        index = self._get_vault_index()
+        if index is not None:
+            # The index covers the whole vault tree: a miss means not found
+            filename = relative_path.split('/')[-1]
+            file = index.get(filename)
+            if file:
+                self._file_cache[relative_path] = file
+            else:
+                logger.warning(f"File not found in vault: {filename}")
+            return file
 
-        return False
+        file_id = self._find_file_id_by_path(relative_path)
+        if not file_id:
+            return None
+        file = {'id': file_id, 'modifiedTime': None, 'md5Checksum': None}
+        self._file_cache[relative_path] = file
+        return file
 
-    def _get_file_id_by_path(self, relative_path: str) -> Optional[str]:
+    def _find_file_id_by_path(self, relative_path: str) -> Optional[str]:
         """
-        Get file ID by relative path within vault
-
-        This method first tries to find by filename only (flexible),
-        then falls back to exact path matching (strict)
+        Look up file ID by relative path within vault in Drive (uncached)
 
         Args:
-            relative_path: Path relative to vault root (e.g., "01. Inbox/note.md")
+            relative_path: Path relative to vault root
 
         Returns:
             str: File ID or None if not found
@@ -411,7 +868,12 @@ class VaultDriveClient:
 
         # Traverse folders
         for i, part in enumerate(parts[:-1]):
-            query = f"name='{part}' and '{current_folder_id}' in parents and mimeType='application/vnd.google-apps.folder' and trashed=false"
+            cached_folder_id = self._folder_id_cache.get((current_folder_id, part))
+            if cached_folder_id:
+                current_folder_id = cached_folder_id
+                continue
+
+            query = f"name='{_escape_q(part)}' and '{current_folder_id}' in parents and mimeType='application/vnd.google-apps.folder' and trashed=false"
             try:
                 results = self.drive_service.files().list(
                     q=query,
@@ -422,13 +884,14 @@ class VaultDriveClient:
                 if not folders:
                     logger.warning(f"Folder not found: {part} in path {relative_path}")
                     return None
+                self._folder_id_cache[(current_folder_id, part)] = folders[0]['id']
                 current_folder_id = folders[0]['id']
             except HttpError as e:
                 logger.error(f"Error finding folder {part}: {e}")
                 return None
 
         # Find file in specific folder
-        query = f"name='{filename}' and '{current_folder_id}' in parents and trashed=false"
+        query = f"name='{_escape_q(filename)}' and '{current_folder_id}' in parents and trashed=false"
         try:
             results = self.drive_service.files().list(
                 q=query,
@@ -459,14 +922,14 @@ class VaultDriveClient:
             return None
 
         try:
-            request = self.drive_service.files().get_media(fileId=file_id)
-            fh = io.BytesIO()
-            downloader = MediaIoBaseDownload(fh, request)
-            done = False
-            while not done:
-                status, done = downloader.next_chunk()
-
-            content = fh.getvalue().decode('utf-8')
+            # Markdown notes are small: fetch alt=media in a single request
+            content = _retry_http(
+                self.drive_service.files().get_media(
+                    fileId=file_id,
+                    supportsAllDrives=True
+                ).execute,
+                f"reading file {relative_path}"
+            ).decode('utf-8')
             logger.info(f"Read file from vault: {relative_path}")
             return content
         except HttpError as e:
@@ -477,6 +940,9 @@ class VaultDriveClient:
         """
         Write or update markdown file in vault
 
+        Existing files whose content already matches (by Drive's
+        md5Checksum) are left untouched.
+
         Args:
             relative_path: Path relative to vault root
             content: File content
@@ -484,22 +950,52 @@ class VaultDriveClient:
         Returns:
             bool: True if successful
         """
-        file_id = self._get_file_id_by_path(relative_path)
+        file = self._resolve_file(relative_path)
+        file_id = file['id'] if file else None
+        data = content.encode('utf-8')
 
-        try:
-            media = MediaIoBaseUpload(
-                io.BytesIO(content.encode('utf-8')),
+        if file_id:
+            checksum = file.get('md5Checksum')
+            if checksum is None:
+                try:
+                    checksum = self.drive_service.files().get(
+                        fileId=file_id,
+                        fields='md5Checksum',
+                        supportsAllDrives=True
+                    ).execute().get('md5Checksum')
+                except HttpError as e:
+                    logger.debug(f"Could not get checksum of {relative_path}: {e}")
+            if checksum and checksum == hashlib.md5(data, usedforsecurity=False).hexdigest():
+                logger.debug(f"Skipping unchanged file in vault: {relative_path}")
+                return True
+
+        def new_media():
+            if len(data) < RESUMABLE_UPLOAD_THRESHOLD:
+                # Single multipart request instead of session init + upload
+                return MediaInMemoryUpload(data, mimetype='text/markdown', resumable=False)
+            return MediaIoBaseUpload(
+                io.BytesIO(data),
                 mimetype='text/markdown',
                 resumable=True
             )
 
+        try:
             if file_id:
-                # Update existing file
-                self.drive_service.files().update(
-                    fileId=file_id,
-                    media_body=media,
-                    supportsAllDrives=True
-                ).execute()
+                # Update existing file (a fresh upload stream per attempt)
+                updated = _retry_http(
+                    lambda: self.drive_service.files().update(
+                        fileId=file_id,
+                        media_body=new_media(),
+                        fields='id, modifiedTime, md5Checksum',
+                        supportsAllDrives=True
+                    ).execute(),
+                    f"updating file {relative_path}"
+                )
+                self._file_cache[relative_path] = {
+                    'id': file_id,
+                    'modifiedTime': updated.get('modifiedTime'),
+                    'md5Checksum': updated.get('md5Checksum')
+                }
                 logger.info(f"Updated file in vault: {relative_path}")
             else:
                 # Create new file
@@ -507,7 +1003,8 @@ class VaultDriveClient:
                 filename = parts[-1]
 
                 # Ensure parent folders exist
-                parent_id = self._ensure_folders_exist('/'.join(parts[:-1]))
+                with self._folder_lock:
+                    parent_id = self._ensure_folders_exist('/'.join(parts[:-1]))
 
                 file_metadata = {
                     'name': filename,
@@ -515,12 +1012,20 @@ class VaultDriveClient:
                     'mimeType': 'text/markdown'
                 }
 
-                self.drive_service.files().create(
+                # Not retried: a create that failed after reaching Drive
+                # would leave a duplicate file behind
+                created = self.drive_service.files().create(
                     body=file_metadata,
-                    media_body=media,
-                    fields='id',
+                    media_body=new_media(),
+                    fields='id, modifiedTime, md5Checksum',
                     supportsAllDrives=True
                 ).execute()
+                if created.get('id'):
+                    self._file_cache[relative_path] = {
+                        'id': created['id'],
+                        'modifiedTime': created.get('modifiedTime'),
+                        'md5Checksum': created.get('md5Checksum')
+                    }
                 logger.info(f"Created new file in vault: {relative_path}")
 
             return True
@@ -532,6 +1037,10 @@ class VaultDriveClient:
         """
         Ensure folder path exists, create if necessary
 
+        Folders already known from the vault index are not looked up again.
+        A folder missing from a built index, or below a folder that had to
+        be created, cannot exist, so it is created without querying first.
+
         Args:
             folder_path: Folder path relative to vault root
 
@@ -543,22 +1052,32 @@ class VaultDriveClient:
 
         parts = folder_path.split('/')
         current_folder_id = self.vault_folder_id
+        # The index covers the whole vault tree: a miss means not found
+        known_missing = self._vault_index is not None
 
         for part in parts:
             if not part:
                 continue
 
-            # Check if folder exists
-            query = f"name='{part}' and '{current_folder_id}' in parents and mimeType='application/vnd.google-apps.folder' and trashed=false"
-            results = self.drive_service.files().list(
-                q=query,
-                spaces='drive',
-                fields='files(id, name)'
-            ).execute()
-            folders = results.get('files', [])
+            cached_folder_id = self._folder_id_cache.get((current_folder_id, part))
+            if cached_folder_id:
+                current_folder_id = cached_folder_id
+                continue
+
+            if known_missing:
+                folders = []
+            else:
+                # Check if folder exists
+                query = f"name='{_escape_q(part)}' and '{current_folder_id}' in parents and mimeType='application/vnd.google-apps.folder' and trashed=false"
+                results = self.drive_service.files().list(
+                    q=query,
+                    spaces='drive',
+                    fields='files(id, name)'
+                ).execute()
+                folders = results.get('files', [])
 
             if folders:
-                current_folder_id = folders[0]['id']
+                folder_id = folders[0]['id']
             else:
                 # Create folder
                 file_metadata = {
@@ -571,9 +1090,13 @@ class VaultDriveClient:
                     fields='id',
                     supportsAllDrives=True
                 ).execute()
-                current_folder_id = folder.get('id')
+                folder_id = folder.get('id')
+                known_missing = True
                 logger.info(f"Created folder: {part}")
 
+            self._folder_id_cache[(current_folder_id, part)] = folder_id
+            current_folder_id = folder_id
+
         return current_folder_id
 
     def get_modified_time(self, relative_path: str) -> Optional[datetime]:
@@ -586,16 +1109,20 @@ class VaultDriveClient:
         Returns:
             datetime: Last modified timestamp or None if not found
         """
-        file_id = self._get_file_id_by_path(relative_path)
-        if not file_id:
+        file = self._resolve_file(relative_path)
+        if not file:
             return None
 
         try:
-            file = self.drive_service.files().get(
-                fileId=file_id,
-                fields='modifiedTime'
-            ).execute()
             modified_time_str = file.get('modifiedTime')
+            if not modified_time_str:
+                modified_time_str = _retry_http(
+                    self.drive_service.files().get(
+                        fileId=file['id'],
+                        fields='modifiedTime'
+                    ).execute,
+                    f"getting modified time for {relative_path}"
+                ).get('modifiedTime')
             modified_time = datetime.fromisoformat(modified_time_str.replace('Z', '+00:00'))
             logger.debug(f"File {relative_path} modified at: {modified_time}")
             return modified_time
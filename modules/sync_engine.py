@@ -4,11 +4,20 @@ Sync Engine Module
 Core synchronization logic for Google Docs -> Obsidian Vault (one-way sync)
 """
 
+import hashlib
 import json
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import List, Dict, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .gdrive_client import GoogleDocsClient, VaultDriveClient
 from .converter import DocumentConverter
 from .conflict_handler import ConflictHandler
@@ -20,6 +29,19 @@ logger = logging.getLogger(__name__)
 STATE_DIR = os.getenv('STATE_DIR', '/data' if os.path.exists('/data') else os.getcwd())
 STATE_FILE_PATH = os.path.join(STATE_DIR, '.sync_state.json')
 
+# Mappings synced concurrently; lower it if Drive starts answering 429
+SYNC_WORKERS = 8
+
+# Per-file state timestamps, kept as datetime in memory and ISO strings on disk
+STATE_TIME_FIELDS = ('last_synced_at', 'doc_modified_at', 'vault_modified_at')
+
+
+def _json_default(obj):
+    """Serialize values json doesn't handle natively (datetimes as ISO 8601)"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
 
 class SyncEngine:
     """Main synchronization engine"""
@@ -28,7 +50,8 @@ class SyncEngine:
         self,
         docs_client: GoogleDocsClient,
         vault_client: VaultDriveClient,
-        mappings: List[Dict]
+        mappings: List[Dict],
+        max_workers: Optional[int] = None
     ):
         """
         Initialize sync engine
@@ -37,12 +60,23 @@ class SyncEngine:
             docs_client: Google Docs client (Account A)
             vault_client: Vault Drive client (Account B)
             mappings: List of doc_id to vault_path mappings
+            max_workers: Mappings synced concurrently (default SYNC_WORKERS)
         """
         self.docs_client = docs_client
         self.vault_client = vault_client
         self.mappings = mappings
+        self.max_workers = max_workers or SYNC_WORKERS
+        # Guards self.state['files'], which the sync workers update
+        self._state_lock = threading.Lock()
+        # Modified times fetched up front for the current sync_all
+        self._doc_modified_times: Dict[str, datetime] = {}
+        self._vault_modified_times: Dict[str, Optional[datetime]] = {}
+        # Drive changes token to store once the current sync_all succeeds
+        self._next_changes_token: Optional[str] = None
         self.converter = DocumentConverter()
         self.conflict_handler = ConflictHandler()
+        # Digest of the state as last loaded or saved, to skip unchanged saves
+        self._state_hash: Optional[bytes] = None
         self.state = self._load_state()
 
     def _load_state(self) -> Dict:
@@ -54,8 +88,16 @@ class SyncEngine:
         """
         try:
             if os.path.exists(STATE_FILE_PATH):
-                with open(STATE_FILE_PATH, 'r') as f:
-                    state = json.load(f)
+                with open(STATE_FILE_PATH, 'rb') as f:
+                    data = f.read()
+                state = orjson.loads(data) if orjson is not None else json.loads(data)
+                # Parse timestamps once here instead of on every sync cycle
+                for file_state in state.get('files', {}).values():
+                    for field in STATE_TIME_FIELDS:
+                        value = file_state.get(field)
+                        if value:
+                            file_state[field] = datetime.fromisoformat(value)
+                self._state_hash = self._hash_payload(self._serialize_state(state))
                 logger.info(f"Loaded sync state from {STATE_FILE_PATH}")
                 return state
             else:
@@ -77,14 +119,65 @@ class SyncEngine:
             'files': {}
         }
 
+    @staticmethod
+    def _serialize_state(state: Dict) -> bytes:
+        """
+        Serialize sync state the way it is stored on disk
+
+        Compact JSON, written with orjson when available. Datetimes are
+        written as ISO 8601 strings.
+
+        Args:
+            state: Sync state
+
+        Returns:
+            bytes: State file content
+        """
+        if orjson is not None:
+            return orjson.dumps(state, default=str)
+        return json.dumps(state, separators=(',', ':'), default=_json_default).encode('utf-8')
+
+    @staticmethod
+    def _hash_payload(payload: bytes) -> bytes:
+        """
+        Digest serialized state for change detection
+
+        Args:
+            payload: State file content
+
+        Returns:
+            bytes: Digest of the content
+        """
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
     def _save_state(self):
-        """Save sync state to local file"""
+        """Save sync state to local file, unless it is unchanged since load or last save"""
         try:
+            payload = self._serialize_state(self.state)
+            payload_hash = self._hash_payload(payload)
+            if payload_hash == self._state_hash:
+                logger.debug("Sync state unchanged, not saving")
+                return
+
             # Ensure the state directory exists
             os.makedirs(os.path.dirname(STATE_FILE_PATH), exist_ok=True)
 
-            with open(STATE_FILE_PATH, 'w') as f:
-                json.dump(self.state, f, indent=2, default=str)
+            # Write a sibling temp file and swap it in, so a crash mid-write
+            # never leaves a truncated state file (which would force a full re-sync)
+            tmp_path = STATE_FILE_PATH + '.tmp'
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, STATE_FILE_PATH)
+            except Exception:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+            self._state_hash = payload_hash
             logger.info(f"Saved sync state to {STATE_FILE_PATH}")
         except Exception as e:
             logger.error(f"Error saving state: {e}")
@@ -98,6 +191,10 @@ class SyncEngine:
         """
         logger.info(f"Starting sync for {len(self.mappings)} mappings")
 
+        # Drive IDs are only reused within a run, so files moved or trashed
+        # in the vault between runs are looked up again
+        self.vault_client.clear_cache()
+
         results = {
             'success': 0,
             'conflicts': 0,
@@ -106,39 +203,54 @@ class SyncEngine:
             'details': []
         }
 
-        for mapping in self.mappings:
+        self._prefetch_modified_times()
+
+        def sync_mapping(mapping: Dict) -> Dict:
             doc_id = mapping['doc_id']
             vault_path = mapping['vault_path']
-
             try:
                 result = self._sync_single(doc_id, vault_path)
-
-                if result['status'] == 'success':
-                    results['success'] += 1
-                elif result['status'] == 'conflict':
-                    results['conflicts'] += 1
-                elif result['status'] == 'skipped':
-                    results['skipped'] += 1
-                else:
-                    results['errors'] += 1
-
-                results['details'].append({
-                    'doc_id': doc_id,
-                    'vault_path': vault_path,
-                    'result': result
-                })
-
             except Exception as e:
                 logger.error(f"Error syncing {doc_id} <-> {vault_path}: {e}")
-                results['errors'] += 1
-                results['details'].append({
-                    'doc_id': doc_id,
-                    'vault_path': vault_path,
-                    'result': {'status': 'error', 'error': str(e)}
-                })
+                result = {'status': 'error', 'error': str(e)}
+            return {
+                'doc_id': doc_id,
+                'vault_path': vault_path,
+                'result': result
+            }
 
-        # Update last run time
-        self.state['last_run'] = datetime.now(timezone.utc).isoformat()
+        # Each mapping is dominated by API latency, so they run concurrently;
+        # details keep the mapping order
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix='sync'
+        ) as executor:
+            details = list(executor.map(sync_mapping, self.mappings))
+
+        for detail in details:
+            status = detail['result']['status']
+            if status == 'success':
+                results['success'] += 1
+            elif status == 'conflict':
+                results['conflicts'] += 1
+            elif status == 'skipped':
+                results['skipped'] += 1
+            else:
+                results['errors'] += 1
+                # The changes feed won't report this doc again, so make the
+                # next run fetch its modified time instead of trusting the state
+                file_state = self.state['files'].get(detail['doc_id'])
+                if file_state:
+                    file_state.pop('doc_modified_at', None)
+        results['details'] = details
+
+        # Update last run time only when something was synced, so idle
+        # cycles leave the state file untouched
+        if results['success'] + results['conflicts'] > 0:
+            self.state['last_run'] = datetime.now(timezone.utc).isoformat()
+        if self._next_changes_token:
+            self.state['changes_token'] = self._next_changes_token
+        self._prune_state()
         self._save_state()
 
         logger.info(f"Sync completed: {results['success']} success, "
@@ -147,6 +259,86 @@ class SyncEngine:
 
         return results
 
+    def _prefetch_modified_times(self):
+        """
+        Fetch the modified times of all mapped docs and vault files at once
+
+        With a changes token from the previous run, only docs reported by
+        the Drive changes feed need a new modified time; the others keep the
+        one recorded at their last sync. Remaining doc times come from batch
+        requests (up to 100 per HTTP call) and vault times from the vault
+        index. Anything missing is fetched per mapping by _sync_single.
+        """
+        self._doc_modified_times = {}
+        self._vault_modified_times = {}
+        if not self.mappings:
+            return
+
+        doc_ids = [mapping['doc_id'] for mapping in self.mappings]
+        changed = self._poll_changes()
+        if changed is not None:
+            for doc_id in doc_ids:
+                if doc_id in changed:
+                    modified_time = changed[doc_id]
+                else:
+                    modified_time = self.state['files'].get(doc_id, {}).get('doc_modified_at')
+                if modified_time:
+                    self._doc_modified_times[doc_id] = modified_time
+            logger.info(f"{len(changed)} file(s) changed in Drive since last sync")
+
+        missing = [doc_id for doc_id in doc_ids if doc_id not in self._doc_modified_times]
+        if missing:
+            try:
+                self._doc_modified_times.update(
+                    self.docs_client.get_modified_times_batch(missing)
+                )
+            except Exception as e:
+                logger.warning(f"Error prefetching doc modified times: {e}")
+
+        try:
+            self._vault_modified_times = self.vault_client.get_modified_times_batch(
+                [mapping['vault_path'] for mapping in self.mappings]
+            )
+        except Exception as e:
+            logger.warning(f"Error prefetching vault modified times: {e}")
+
+    def _poll_changes(self) -> Optional[Dict[str, Optional[datetime]]]:
+        """
+        Read the Drive changes feed since the stored changes token
+
+        Sets self._next_changes_token for sync_all to store. Without a
+        stored token (first run), a new one is requested and None returned.
+
+        Returns:
+            dict: Changed file ID -> modified time (None if removed), or None
+                if every doc's modified time has to be fetched
+        """
+        token = self.state.get('changes_token')
+        self._next_changes_token = None
+        try:
+            if token:
+                changed, self._next_changes_token = self.docs_client.get_changes(token)
+                return changed
+            self._next_changes_token = self.docs_client.get_start_page_token()
+        except Exception as e:
+            # A stale or rejected token is replaced on the next run
+            logger.warning(f"Error reading Drive changes, checking every doc: {e}")
+            self.state.pop('changes_token', None)
+        return None
+
+    def _prune_state(self):
+        """Drop state entries of docs that are no longer mapped"""
+        if not self.mappings:
+            # Never wipe the state because of an empty mapping list
+            return
+        active_ids = {mapping['doc_id'] for mapping in self.mappings}
+        files = self.state['files']
+        stale_ids = [doc_id for doc_id in files if doc_id not in active_ids]
+        for doc_id in stale_ids:
+            del files[doc_id]
+        if stale_ids:
+            logger.info(f"Removed {len(stale_ids)} unmapped doc(s) from sync state")
+
     def _sync_single(self, doc_id: str, vault_path: str) -> Dict:
         """
         Synchronize a single document pair
@@ -160,14 +352,19 @@ class SyncEngine:
         """
         logger.info(f"Syncing: {doc_id} <-> {vault_path}")
 
-        # Get modification times
-        try:
-            doc_modified = self.docs_client.get_modified_time(doc_id)
-        except Exception as e:
-            logger.error(f"Error getting doc modified time: {e}")
-            return {'status': 'error', 'error': f'Cannot access doc: {e}'}
+        # Get modification times, prefetched by sync_all when possible
+        doc_modified = self._doc_modified_times.get(doc_id)
+        if doc_modified is None:
+            try:
+                doc_modified = self.docs_client.get_modified_time(doc_id)
+            except Exception as e:
+                logger.error(f"Error getting doc modified time: {e}")
+                return {'status': 'error', 'error': f'Cannot access doc: {e}'}
 
-        vault_modified = self.vault_client.get_modified_time(vault_path)
+        if vault_path in self._vault_modified_times:
+            vault_modified = self._vault_modified_times[vault_path]
+        else:
+            vault_modified = self.vault_client.get_modified_time(vault_path)
 
         # Check if markdown file exists
         markdown_exists = vault_modified is not None
@@ -175,8 +372,6 @@ class SyncEngine:
         # Get last sync info
         file_state = self.state['files'].get(doc_id, {})
         last_synced = file_state.get('last_synced_at')
-        if last_synced:
-            last_synced = datetime.fromisoformat(last_synced)
 
         # Determine sync direction
         sync_decision = self._determine_sync_direction(
@@ -187,24 +382,42 @@ class SyncEngine:
 
         # Skip if no changes
         if sync_decision['action'] == 'skip':
+            if file_state.get('doc_modified_at') != doc_modified:
+                # Re-record a time dropped after a failed sync, so later runs
+                # can rely on the changes feed for this doc again
+                with self._state_lock:
+                    file_state['doc_modified_at'] = doc_modified
             return {'status': 'skipped', 'reason': sync_decision['reason']}
 
+        # The last written markdown can only be trusted to still be in the
+        # vault if the file exists, is at the same path and was not edited since
+        previous_hash = None
+        if (
+            markdown_exists
+            and last_synced
+            and vault_modified <= last_synced
+            and file_state.get('vault_path') == vault_path
+        ):
+            previous_hash = file_state.get('content_hash')
+
         # Perform sync (ONE-WAY only: doc -> vault)
         try:
             if sync_decision['action'] == 'doc_to_vault':
-                self._sync_doc_to_vault(doc_id, vault_path)
+                content_hash = self._sync_doc_to_vault(doc_id, vault_path, previous_hash)
                 direction = 'doc_to_vault'
             else:
                 return {'status': 'error', 'error': f"Unknown action: {sync_decision['action']}"}
 
             # Update state
-            self.state['files'][doc_id] = {
-                'last_synced_at': datetime.now(timezone.utc).isoformat(),
-                'doc_modified_at': doc_modified.isoformat(),
-                'vault_modified_at': vault_modified.isoformat() if vault_modified else None,
-                'direction': direction,
-                'vault_path': vault_path
-            }
+            with self._state_lock:
+                self.state['files'][doc_id] = {
+                    'last_synced_at': datetime.now(timezone.utc),
+                    'doc_modified_at': doc_modified,
+                    'vault_modified_at': vault_modified,
+                    'direction': direction,
+                    'vault_path': vault_path,
+                    'content_hash': content_hash
+                }
 
             return {
                 'status': 'success',
@@ -274,13 +487,23 @@ class SyncEngine:
             'reason': 'No changes since last sync'
         }
 
-    def _sync_doc_to_vault(self, doc_id: str, vault_path: str):
+    def _sync_doc_to_vault(
+        self,
+        doc_id: str,
+        vault_path: str,
+        previous_hash: Optional[str] = None
+    ) -> str:
         """
         Sync Google Doc to Markdown in vault
 
         Args:
             doc_id: Google Doc ID
             vault_path: Vault file path
+            previous_hash: Hash of the markdown already in the vault, if known;
+                the upload is skipped when the new markdown matches it
+
+        Returns:
+            str: Hash of the converted markdown
         """
         logger.info(f"Syncing doc -> vault: {doc_id} -> {vault_path}")
 
@@ -289,22 +512,38 @@ class SyncEngine:
 
         # Convert to markdown
         markdown = self.converter.html_to_markdown(html_content)
+        content_hash = hashlib.blake2b(markdown.encode('utf-8'), digest_size=16).hexdigest()
+
+        if content_hash == previous_hash:
+            # The doc was touched but renders to the same markdown
+            logger.info(f"Markdown unchanged, skipping upload: {vault_path}")
+            return content_hash
 
         # Write to vault
         self.vault_client.write_file(vault_path, markdown)
 
         logger.info(f"Successfully synced doc to vault: {vault_path}")
+        return content_hash
 
     def get_sync_status(self) -> Dict:
         """
         Get current sync status
 
+        Timestamps are returned as ISO 8601 strings, as stored on disk.
+
         Returns:
             dict: Status information
         """
+        files = {
+            doc_id: {
+                key: value.isoformat() if isinstance(value, datetime) else value
+                for key, value in file_state.items()
+            }
+            for doc_id, file_state in self.state.get('files', {}).items()
+        }
         return {
             'last_run': self.state.get('last_run'),
-            'total_files': len(self.state.get('files', {})),
-            'files': self.state.get('files', {}),
+            'total_files': len(files),
+            'files': files,
             'pending_conflicts': self.conflict_handler.get_conflicts_count()
         }
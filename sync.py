@@ -7,13 +7,11 @@ Main entry point for the synchronization service
 
 import os
 import sys
-import yaml
 import json
 import logging
 import argparse
 import signal
-import time
-import schedule
+import threading
 from datetime import datetime
 
 from modules.auth import DualAccountAuth
@@ -32,47 +30,102 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-# Global flag for graceful shutdown
-shutdown_flag = False
+DEFAULT_SHEET_RANGE = 'Sheet1!A:B'
+
+# Set to request a graceful shutdown; also wakes the main loop from its wait
+shutdown_event = threading.Event()
+
+# Authentication shared by the sheet reloads and the sync services
+_auth = None
+
+# Sheets client and last read mappings, reused while the sheet is unchanged
+_sheets_client = None
+_sheet_cache = None  # (sheet_id, sheet_range, modifiedTime, mappings)
 
 
 def signal_handler(signum, frame):
     """Handle shutdown signals"""
-    global shutdown_flag
     logger.info(f"Received signal {signum}, initiating graceful shutdown...")
-    shutdown_flag = True
+    shutdown_event.set()
+
+
+def get_auth() -> DualAccountAuth:
+    """
+    Get the process-wide authentication, creating it on first use
+
+    Credentials refresh their own tokens, so one instance serves every
+    sync cycle instead of signing new tokens on each reload.
+
+    Returns:
+        DualAccountAuth: Authenticated credentials for both accounts
+    """
+    global _auth
+    if _auth is None:
+        auth = DualAccountAuth()
+        if not auth.is_authenticated():
+            raise ValueError("Authentication failed. Check credentials environment variables.")
+        _auth = auth
+    return _auth
 
 
 def reload_sheet_mappings(config: dict) -> list:
     """
     Reload mappings from Google Sheet.
 
+    The sheet is only read again when its Drive modifiedTime changed since
+    the last successful read.
+
     Args:
         config: Configuration dictionary
 
     Returns:
         list of mappings, or None if Sheet is not configured or read fails
     """
-    sheet_id = os.getenv('SHEET_ID') or config.get('sheet_id')
+    sheet_id = config.get('sheet_id')
     if not sheet_id:
         return None
-    sheet_range = os.getenv('SHEET_RANGE', config.get('sheet_range', 'Sheet1!A:B'))
-    logger.info(f"Loading mappings from Google Sheet {sheet_id} range {sheet_range}")
+    global _sheets_client, _sheet_cache
+    sheet_range = config.get('sheet_range', DEFAULT_SHEET_RANGE)
     try:
-        auth = DualAccountAuth()
-        if not auth.is_authenticated():
-            raise ValueError("Authentication failed while loading Google Sheet mappings")
-        sheets_client = GoogleSheetsClient(auth.get_account_a_credentials())
-        sheet_mappings = sheets_client.get_mappings(sheet_id, sheet_range)
+        if _sheets_client is None:
+            _sheets_client = GoogleSheetsClient(get_auth().get_account_a_credentials())
+
+        modified_time = _sheets_client.get_modified_time(sheet_id)
+        if modified_time and _sheet_cache and _sheet_cache[:3] == (sheet_id, sheet_range, modified_time):
+            logger.info(f"Google Sheet {sheet_id} unchanged, keeping {len(_sheet_cache[3])} mapping(s)")
+            return _sheet_cache[3]
+
+        logger.info(f"Loading mappings from Google Sheet {sheet_id} range {sheet_range}")
+        sheet_mappings = _sheets_client.get_mappings(sheet_id, sheet_range)
         if not sheet_mappings:
             raise ValueError("No mappings found in Google Sheet")
         logger.info(f"Loaded {len(sheet_mappings)} mapping(s) from Google Sheet")
+        _sheet_cache = (sheet_id, sheet_range, modified_time, sheet_mappings)
         return sheet_mappings
     except Exception as e:
         logger.warning(f"Failed to reload sheet mappings, keeping current: {e}")
         return None
 
 
+def load_yaml(stream):
+    """
+    Parse YAML, importing PyYAML only when a YAML config is actually used
+
+    Args:
+        stream: YAML text or file object
+
+    Returns:
+        Parsed YAML document
+    """
+    import yaml
+    try:
+        # libyaml-backed loader, much faster than the pure-Python SafeLoader
+        from yaml import CSafeLoader as YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as YamlLoader
+    return yaml.load(stream, Loader=YamlLoader)
+
+
 def load_config(config_path: str = None) -> dict:
     """
     Load configuration from file or environment
@@ -87,7 +140,7 @@ def load_config(config_path: str = None) -> dict:
     if config_path and os.path.exists(config_path):
         logger.info(f"Loading config from {config_path}")
         with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+            config = load_yaml(f)
     else:
         # Build config from individual environment variables (preferred)
         logger.info("Loading config from environment variables")
@@ -101,7 +154,7 @@ def load_config(config_path: str = None) -> dict:
         config_yaml = os.getenv('CONFIG_YAML')
         if config_yaml:
             try:
-                yaml_config = yaml.safe_load(config_yaml)
+                yaml_config = load_yaml(config_yaml)
                 if isinstance(yaml_config, dict):
                     for key, value in yaml_config.items():
                         if not config.get(key):
@@ -109,15 +162,17 @@ def load_config(config_path: str = None) -> dict:
             except Exception as e:
                 logger.warning(f"Failed to parse CONFIG_YAML, ignoring: {e}")
 
+    # Resolve the sheet source once; SHEET_ID / SHEET_RANGE override the file
+    sheet_id = os.getenv('SHEET_ID') or config.get('sheet_id')
+    if sheet_id:
+        config['sheet_id'] = sheet_id
+        config['sheet_range'] = os.getenv('SHEET_RANGE', config.get('sheet_range', DEFAULT_SHEET_RANGE))
+
     # Optional: override mappings from Google Sheet if provided
     sheet_mappings = reload_sheet_mappings(config)
     if sheet_mappings is not None:
         config['mappings'] = sheet_mappings
-        sheet_id = os.getenv('SHEET_ID') or config.get('sheet_id')
-        if sheet_id:
-            config['sheet_id'] = sheet_id
-            config['sheet_range'] = os.getenv('SHEET_RANGE', config.get('sheet_range', 'Sheet1!A:B'))
-    elif os.getenv('SHEET_ID') or config.get('sheet_id'):
+    elif sheet_id:
         # Sheet was configured but reload failed — fatal on startup
         raise ValueError("Failed to load mappings from Google Sheet on startup")
 
@@ -136,10 +191,8 @@ def initialize_services(config: dict):
     """
     logger.info("Initializing services...")
 
-    # Initialize authentication
-    auth = DualAccountAuth()
-    if not auth.is_authenticated():
-        raise ValueError("Authentication failed. Check credentials environment variables.")
+    # Initialize authentication (shared with the sheet reloads)
+    auth = get_auth()
 
     # Get credentials
     account_a_creds = auth.get_account_a_credentials()
@@ -156,7 +209,8 @@ def initialize_services(config: dict):
     sync_engine = SyncEngine(
         docs_client=docs_client,
         vault_client=vault_client,
-        mappings=config['mappings']
+        mappings=config['mappings'],
+        max_workers=config.get('max_workers')
     )
 
     logger.info("Services initialized successfully")
@@ -232,25 +286,20 @@ def run_continuous(config: dict):
             sync_engine.mappings = new_mappings
         run_sync(sync_engine)
 
-    # Schedule sync
-    schedule.every(interval).seconds.do(sync_with_refresh)
-
     # Run initial sync immediately
     sync_with_refresh()
 
     logger.info("Entering main loop... Press Ctrl+C to stop")
 
-    # Main loop
-    while not shutdown_flag:
+    # Main loop: sleep until the next sync is due, waking early on shutdown
+    while not shutdown_event.wait(interval):
         try:
-            schedule.run_pending()
-            time.sleep(1)
+            sync_with_refresh()
         except KeyboardInterrupt:
             logger.info("Keyboard interrupt received")
             break
         except Exception as e:
             logger.error(f"Error in main loop: {e}", exc_info=True)
-            time.sleep(5)  # Wait before retrying
 
     logger.info("Shutting down gracefully")
 
@@ -266,22 +315,26 @@ def show_status(config: dict):
         docs_client, vault_client, sync_engine = initialize_services(config)
         status = sync_engine.get_sync_status()
 
-        print("\n" + "=" * 80)
-        print("SYNC STATUS")
-        print("=" * 80)
-        print(f"Last run: {status['last_run']}")
-        print(f"Total files tracked: {status['total_files']}")
-        print(f"Pending conflicts: {status['pending_conflicts']}")
-        print("\nFile Status:")
-        print("-" * 80)
+        # Build the whole report and write it once rather than per line
+        out = [
+            "\n" + "=" * 80,
+            "SYNC STATUS",
+            "=" * 80,
+            f"Last run: {status['last_run']}",
+            f"Total files tracked: {status['total_files']}",
+            f"Pending conflicts: {status['pending_conflicts']}",
+            "\nFile Status:",
+            "-" * 80,
+        ]
 
         for doc_id, file_info in status.get('files', {}).items():
-            print(f"\nDoc ID: {doc_id}")
-            print(f"  Path: {file_info.get('vault_path')}")
-            print(f"  Last synced: {file_info.get('last_synced_at')}")
-            print(f"  Direction: {file_info.get('direction')}")
+            out.append(f"\nDoc ID: {doc_id}")
+            out.append(f"  Path: {file_info.get('vault_path')}")
+            out.append(f"  Last synced: {file_info.get('last_synced_at')}")
+            out.append(f"  Direction: {file_info.get('direction')}")
 
-        print("=" * 80)
+        out.append("=" * 80)
+        sys.stdout.write('\n'.join(out) + '\n')
 
     except Exception as e:
         logger.error(f"Error showing status: {e}", exc_info=True)
@@ -337,7 +390,7 @@ def main():
         # Validate config
         if not config.get('vault_folder_id'):
             raise ValueError("vault_folder_id not found in config")
-        if not config.get('mappings') and not (os.getenv('SHEET_ID') or config.get('sheet_id')):
+        if not config.get('mappings') and not config.get('sheet_id'):
             raise ValueError("No mappings configured and no SHEET_ID provided")
 
         logger.info(f"Loaded {len(config['mappings'])} mapping(s)")